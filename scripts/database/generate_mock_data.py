@@ -9,8 +9,16 @@ Usage: python scripts/database/generate_mock_data.py
 
 import json
 import random
+import string
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json produces the same output
+    orjson = None
+
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR / "data"
 
@@ -24,8 +32,38 @@ PERIODS = [
     {"fiscal_year": 2025, "fiscal_quarter": "Q1", "call_date": "2025-02-27", "period_end": "2025-01-31"},
 ]
 
+# Growth multiplier per period index: ~2% per quarter times a seasonal factor
+# (Q4 typically strong)
+_SEASONAL = (0.98, 1.0, 0.99, 1.03, 1.02)
+QUARTER_VARIATIONS = tuple((1 + (i * 0.02)) * _SEASONAL[i] for i in range(len(PERIODS)))
+
+# Stock price growth multiplier per period index (~3% per quarter average)
+_STOCK_GROWTH_RATE = 0.03
+STOCK_GROWTH = tuple((1 + _STOCK_GROWTH_RATE) ** i for i in range(len(PERIODS)))
+
+# Quarter descriptions used in prepared remarks
+QUARTER_DESCS = {
+    "Q1": "first quarter",
+    "Q2": "second quarter",
+    "Q3": "third quarter",
+    "Q4": "fourth quarter and full year"
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BankConfig:
+    """Static profile used to generate a bank's mock data."""
+    name: str
+    ceo: str
+    cfo: str
+    cro: str
+    themes: list
+    base_metrics: dict
+    stock_base: float
+
+
 # Bank configurations with base metrics and themes
-BANKS = {
+_BANK_DATA = {
     "RY": {
         "name": "Royal Bank of Canada",
         "ceo": "Dave McKay",
@@ -136,6 +174,8 @@ BANKS = {
     }
 }
 
+BANKS = {bank_id: BankConfig(**config) for bank_id, config in _BANK_DATA.items()}
+
 # Transcript templates
 MD_TEMPLATES = {
     "RY": """Good morning everyone. I'm {ceo}, President and CEO of Royal Bank of Canada. We're pleased to report {quarter_desc} results that demonstrate the strength of our diversified business model.
@@ -439,6 +479,99 @@ Operator: Our next question comes from {analyst3} with {firm3}.
 Operator: That concludes our Q&A session. Thank you for participating in today's call."""
 }
 
+# Bank-specific Q&A content
+QA_CONTEXT_BY_BANK = {
+    "RY": {
+        "question1": "the outlook for Canadian mortgage growth given the rate environment",
+        "answer1": "We're seeing steady demand in the mortgage market. As rates potentially decline, we expect to see some pickup in activity. Our focus remains on quality originations.",
+        "followup1": "credit in the consumer portfolio",
+        "followup_answer1": "Overall credit performance remains solid. Delinquencies remain well within historical ranges.",
+        "question2": "Can you discuss the sustainability of the capital markets performance",
+        "answer2": "While we benefited from favorable conditions, our capital markets franchise has been consistently gaining share. We've invested in talent and technology.",
+        "expense_question": "how should we think about the efficiency ratio",
+        "expense_answer": "We delivered positive operating leverage this quarter. Our technology investments are driving automation savings.",
+        "question3": "On wealth management, can you talk about the competitive environment",
+        "answer3": "Talent is always competitive. We've been successful in recruiting through our industry-leading platform and training programs."
+    },
+    "TD": {
+        "question1": "can you provide an update on the timeline for completing the AML remediation",
+        "answer1": "We're making substantial progress. We've added over 1,500 people focused on compliance and are upgrading systems. This is a multi-year journey and we're committed to getting it right.",
+        "followup1": "how should we think about growth in US Retail once remediation is complete",
+        "followup_answer1": "We remain committed to the US market. Once we're through this period, we'll look at opportunities to grow. Near-term focus is on execution.",
+        "question2": "Can you talk about net interest margin outlook given potential rate cuts",
+        "answer2": "We're well positioned for various rate scenarios. We've been extending duration on the securities portfolio. We expect NIM to remain relatively stable.",
+        "followup2": "expenses - what's driving the increase",
+        "followup_answer2": "Expense growth reflects our investments in risk and control infrastructure. We expect growth to moderate as we achieve efficiencies.",
+        "question3": "Can you discuss the outlook for the Schwab stake",
+        "answer3": "We plan to manage our position over time in an orderly manner. The timing will depend on market conditions."
+    },
+    "BMO": {
+        "question1": "now that integration is progressing, how should we think about growth opportunities in the US",
+        "answer1": "We're excited about our US positioning. The focus near-term is on driving revenue synergies - cross-selling and bringing our full product suite to customers.",
+        "followup1": "can you quantify the revenue synergy opportunity",
+        "followup_answer1": "We're making good progress on our synergy targets. Mortgage referrals and treasury management cross-sell are up significantly.",
+        "question2": "Can you talk about the commercial real estate portfolio",
+        "answer2": "Our CRE portfolio is well-diversified. Office represents less than 10% and is primarily in Canada with strong tenants. We're comfortable with our reserves.",
+        "capital_question": "with CET1 strong, is there room for additional buybacks",
+        "capital_answer": "We have capacity for buybacks and evaluate it regularly. We want to maintain flexibility while also returning capital to shareholders.",
+        "question3": "how are you thinking about the competitive environment in California",
+        "answer3": "California is a dynamic market with strong demographics. We have advantages - our commercial expertise and now meaningful scale. Client feedback has been positive."
+    },
+    "BNS": {
+        "question1": "Can you provide more details on the timeline for exiting certain Latin American markets",
+        "answer1": "We're making good progress on announced transactions. We expect to close the majority by mid-year with some extending into the second half.",
+        "followup1": "how should we think about reinvesting that capital",
+        "followup_answer1": "Our priority is strengthening the balance sheet and investing in core markets. Canada and Mexico offer attractive opportunities.",
+        "question2": "Can you discuss credit trends in your Canadian retail portfolio",
+        "answer2": "Canadian retail credit remains in good shape. Delinquencies have normalized but are within historical ranges.",
+        "followup2": "Mexico credit outlook",
+        "followup_answer2": "Mexico PCLs are running higher than Canada but in line with expectations. Our through-the-cycle provisioning means we're comfortable with reserves.",
+        "question3": "your efficiency ratio remains above peers - what's the path to closing that gap",
+        "answer3": "Improving efficiency is a key priority. The international rationalization will help. We're also investing in automation and digitization."
+    },
+    "CM": {
+        "question1": "Your mortgage book continues to outperform - what's driving that",
+        "answer1": "A few factors. Conservative underwriting, concentration in urban markets with stronger fundamentals, and our portfolio mix skews toward lower LTV borrowers.",
+        "followup1": "market share in a potentially busier refinancing market",
+        "followup_answer1": "We're well positioned for increased activity. Our branch network and mobile origination tools are excellent.",
+        "question2": "Can you discuss the outlook for capital markets",
+        "answer2": "Our capital markets business is designed to be less volatile given our client focus. We're gaining share in advisory and our trading desk has invested in capabilities.",
+        "expense_question": "how should we think about the trajectory",
+        "expense_answer": "We're committed to positive operating leverage. We continue to invest in technology while achieving efficiencies in other areas.",
+        "question3": "do you see any M&A opportunities that make sense for CIBC",
+        "answer3": "We're very focused on organic growth. We don't feel we need M&A to compete effectively. We'd look at opportunities that strengthen our Canadian franchise."
+    },
+    "NA": {
+        "question1": "Can you provide an update on the Canadian Western Bank acquisition",
+        "answer1": "We're excited about this transaction. Regulatory approvals are progressing. CWB adds scale in Western Canada and diversifies our geographic exposure.",
+        "followup1": "What are the synergy expectations",
+        "followup_answer1": "We've identified meaningful cost synergies primarily in corporate functions and technology. Revenue synergies from product cross-sell are also mapped out.",
+        "question2": "Your ROE continues to lead the industry - what's sustainable going forward",
+        "answer2": "Our ROE reflects our leading Quebec position, efficient operations, and disciplined capital allocation. We see no reason that should change.",
+        "followup2": "on your geographic expansion, how do you compete outside Quebec",
+        "followup_answer2": "We're selective. We focus on commercial banking where relationships matter. We've had success winning clients who appreciate our service model.",
+        "question3": "can you discuss the competitive environment in Quebec",
+        "answer3": "Quebec remains our fortress. We have relationships going back generations. Competitors have tried to gain share with limited success."
+    }
+}
+
+# Metric groups by reporting unit (unlisted metrics are percentages)
+_CAD_MILLIONS_METRICS = frozenset({
+    "total_revenue", "net_income", "net_interest_income", "pcl",
+    "gross_impaired_loans", "non_interest_revenue",
+})
+_CAD_BILLIONS_METRICS = frozenset({"total_assets", "total_loans", "total_deposits", "common_equity", "aum"})
+_CAD_METRICS = frozenset({"diluted_eps", "book_value_per_share", "dividend_per_share"})
+
+# (unit, rounding digits) per metric
+METRIC_UNITS = {
+    **dict.fromkeys(_CAD_MILLIONS_METRICS, ("CAD_millions", 0)),
+    **dict.fromkeys(_CAD_BILLIONS_METRICS, ("CAD_billions", 0)),
+    **dict.fromkeys(_CAD_METRICS, ("CAD", 2)),
+    "pcl_ratio": ("bps", 1),
+}
+_DEFAULT_UNIT = ("percent", 1)
+
 # Analysts for Q&A
 ANALYSTS = [
     ("Gabriel Dechaine", "National Bank Financial"),
@@ -456,6 +589,29 @@ ANALYSTS = [
 ]
 
 
+def compile_template(template):
+    """Parse a str.format template once into (literal, field, spec) segments."""
+    segments = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if conversion:
+            raise ValueError(f"Unsupported conversion !{conversion} in template field {field!r}")
+        segments.append((literal, field, spec or ""))
+    return tuple(segments)
+
+
+def render_template(segments, context):
+    """Render segments from compile_template against a context dict."""
+    return "".join(
+        literal if field is None else literal + format(context[field], spec)
+        for literal, field, spec in segments
+    )
+
+
+COMPILED_MD_TEMPLATES = {bank_id: compile_template(t) for bank_id, t in MD_TEMPLATES.items()}
+COMPILED_QA_TEMPLATES = {bank_id: compile_template(t) for bank_id, t in QA_TEMPLATES.items()}
+
+
+@lru_cache(maxsize=4096)
 def format_currency(value, unit):
     """Format currency values for display."""
     if unit == "CAD_millions":
@@ -475,44 +631,23 @@ def format_currency(value, unit):
 
 def get_quarter_variation(quarter_idx):
     """Get growth multiplier based on quarter progression."""
-    # Simulate gradual growth over quarters
-    base_growth = 1 + (quarter_idx * 0.02)  # ~2% per quarter
-    seasonal = [0.98, 1.0, 0.99, 1.03, 1.02][quarter_idx]  # Q4 typically strong
-    return base_growth * seasonal
+    return QUARTER_VARIATIONS[quarter_idx]
 
 
-def generate_metrics(bank_id, period_idx):
+def generate_metrics(bank, period_idx, rng):
     """Generate financial metrics for a bank/period."""
-    bank = BANKS[bank_id]
-    base = bank["base_metrics"]
-    variation = get_quarter_variation(period_idx)
+    base = bank.base_metrics
+    variation = QUARTER_VARIATIONS[period_idx]
 
     metrics = {}
     for metric_id, base_value in base.items():
         # Add some randomness
-        random_factor = random.uniform(0.97, 1.03)
+        random_factor = rng.uniform(0.97, 1.03)
         value = base_value * variation * random_factor
 
-        # Determine unit based on metric
-        if metric_id in ["total_revenue", "net_income", "net_interest_income", "pcl",
-                         "gross_impaired_loans", "non_interest_revenue"]:
-            unit = "CAD_millions"
-        elif metric_id in ["total_assets", "total_loans", "total_deposits", "common_equity", "aum"]:
-            unit = "CAD_billions"
-        elif metric_id in ["diluted_eps", "book_value_per_share", "dividend_per_share"]:
-            unit = "CAD"
-        elif metric_id == "pcl_ratio":
-            unit = "bps"
-        else:
-            unit = "percent"
-
-        # Round appropriately
-        if unit == "CAD":
-            value = round(value, 2)
-        elif unit in ["percent", "bps"]:
-            value = round(value, 1)
-        else:
-            value = round(value, 0)
+        # Determine unit and rounding based on metric
+        unit, digits = METRIC_UNITS.get(metric_id, _DEFAULT_UNIT)
+        value = round(value, digits)
 
         metrics[metric_id] = {
             "value": value,
@@ -522,31 +657,29 @@ def generate_metrics(bank_id, period_idx):
     return metrics
 
 
-def generate_stock_price(bank_id, period_idx):
+def generate_stock_price(bank, period_idx, rng):
     """Generate stock price data for a bank/period."""
-    bank = BANKS[bank_id]
-    base_price = bank["stock_base"]
+    base_price = bank.stock_base
 
     # Calculate price based on quarter progression
-    growth_rate = 0.03  # ~3% per quarter average
-    price = base_price * (1 + growth_rate) ** period_idx
+    price = base_price * STOCK_GROWTH[period_idx]
 
     # Add randomness
-    price *= random.uniform(0.95, 1.05)
+    price *= rng.uniform(0.95, 1.05)
     price = round(price, 2)
 
     # Calculate changes
     if period_idx > 0:
-        prev_price = base_price * (1 + growth_rate) ** (period_idx - 1)
+        prev_price = base_price * STOCK_GROWTH[period_idx - 1]
         qoq = round((price / prev_price - 1) * 100, 1)
     else:
-        qoq = round(random.uniform(-2, 5), 1)
+        qoq = round(rng.uniform(-2, 5), 1)
 
     if period_idx >= 4:
-        yoy_prev = base_price * (1 + growth_rate) ** (period_idx - 4)
+        yoy_prev = base_price * STOCK_GROWTH[period_idx - 4]
         yoy = round((price / yoy_prev - 1) * 100, 1)
     else:
-        yoy = round(random.uniform(-5, 15), 1)
+        yoy = round(rng.uniform(-5, 15), 1)
 
     return {
         "close_price": price,
@@ -555,33 +688,24 @@ def generate_stock_price(bank_id, period_idx):
     }
 
 
-def generate_transcript_content(bank_id, period, metrics):
+def generate_transcript_content(bank_id, bank, period_idx, metrics, rng):
     """Generate transcript content for a bank/period."""
-    bank = BANKS[bank_id]
-    period_idx = PERIODS.index(period)
+    period = PERIODS[period_idx]
     quarter = period["fiscal_quarter"]
     year = period["fiscal_year"]
 
-    # Quarter descriptions
-    quarter_descs = {
-        "Q1": "first quarter",
-        "Q2": "second quarter",
-        "Q3": "third quarter",
-        "Q4": "fourth quarter and full year"
-    }
-
     # Performance descriptors based on metrics
     net_income = metrics["net_income"]["value"]
-    prev_income = net_income / (1 + random.uniform(0.02, 0.08))
+    prev_income = net_income / (1 + rng.uniform(0.02, 0.08))
     income_change = "up" if net_income > prev_income else "down"
     pct_change = abs((net_income / prev_income - 1) * 100)
 
     # Build context for templates
     context = {
-        "ceo": bank["ceo"],
-        "cfo": bank["cfo"],
-        "cro": bank["cro"],
-        "quarter_desc": quarter_descs[quarter],
+        "ceo": bank.ceo,
+        "cfo": bank.cfo,
+        "cro": bank.cro,
+        "quarter_desc": QUARTER_DESCS[quarter],
         "net_income": metrics["net_income"]["formatted"],
         "eps": metrics["diluted_eps"]["formatted"],
         "cet1": metrics["cet1_ratio"]["value"],
@@ -686,14 +810,14 @@ def generate_transcript_content(bank_id, period, metrics):
         })
 
     # Generate MD section
-    md_content = MD_TEMPLATES[bank_id].format(**context)
+    md_content = render_template(COMPILED_MD_TEMPLATES[bank_id], context)
 
     # Generate QA section
-    analysts = random.sample(ANALYSTS, 3)
+    analysts = rng.sample(ANALYSTS, 3)
     qa_context = {
-        "ceo": bank["ceo"],
-        "cfo": bank["cfo"],
-        "cro": bank["cro"],
+        "ceo": bank.ceo,
+        "cfo": bank.cfo,
+        "cro": bank.cro,
         "analyst1": analysts[0][0],
         "firm1": analysts[0][1],
         "analyst2": analysts[1][0],
@@ -701,112 +825,48 @@ def generate_transcript_content(bank_id, period, metrics):
         "analyst3": analysts[2][0],
         "firm3": analysts[2][1],
     }
-
     # Bank-specific Q&A content
-    if bank_id == "RY":
-        qa_context.update({
-            "question1": "the outlook for Canadian mortgage growth given the rate environment",
-            "answer1": "We're seeing steady demand in the mortgage market. As rates potentially decline, we expect to see some pickup in activity. Our focus remains on quality originations.",
-            "followup1": "credit in the consumer portfolio",
-            "followup_answer1": "Overall credit performance remains solid. Delinquencies remain well within historical ranges.",
-            "question2": "Can you discuss the sustainability of the capital markets performance",
-            "answer2": "While we benefited from favorable conditions, our capital markets franchise has been consistently gaining share. We've invested in talent and technology.",
-            "expense_question": "how should we think about the efficiency ratio",
-            "expense_answer": "We delivered positive operating leverage this quarter. Our technology investments are driving automation savings.",
-            "question3": "On wealth management, can you talk about the competitive environment",
-            "answer3": "Talent is always competitive. We've been successful in recruiting through our industry-leading platform and training programs."
-        })
-    elif bank_id == "TD":
-        qa_context.update({
-            "question1": "can you provide an update on the timeline for completing the AML remediation",
-            "answer1": "We're making substantial progress. We've added over 1,500 people focused on compliance and are upgrading systems. This is a multi-year journey and we're committed to getting it right.",
-            "followup1": "how should we think about growth in US Retail once remediation is complete",
-            "followup_answer1": "We remain committed to the US market. Once we're through this period, we'll look at opportunities to grow. Near-term focus is on execution.",
-            "question2": "Can you talk about net interest margin outlook given potential rate cuts",
-            "answer2": "We're well positioned for various rate scenarios. We've been extending duration on the securities portfolio. We expect NIM to remain relatively stable.",
-            "followup2": "expenses - what's driving the increase",
-            "followup_answer2": "Expense growth reflects our investments in risk and control infrastructure. We expect growth to moderate as we achieve efficiencies.",
-            "question3": "Can you discuss the outlook for the Schwab stake",
-            "answer3": "We plan to manage our position over time in an orderly manner. The timing will depend on market conditions."
-        })
-    elif bank_id == "BMO":
-        qa_context.update({
-            "question1": "now that integration is progressing, how should we think about growth opportunities in the US",
-            "answer1": "We're excited about our US positioning. The focus near-term is on driving revenue synergies - cross-selling and bringing our full product suite to customers.",
-            "followup1": "can you quantify the revenue synergy opportunity",
-            "followup_answer1": "We're making good progress on our synergy targets. Mortgage referrals and treasury management cross-sell are up significantly.",
-            "question2": "Can you talk about the commercial real estate portfolio",
-            "answer2": "Our CRE portfolio is well-diversified. Office represents less than 10% and is primarily in Canada with strong tenants. We're comfortable with our reserves.",
-            "capital_question": "with CET1 strong, is there room for additional buybacks",
-            "capital_answer": "We have capacity for buybacks and evaluate it regularly. We want to maintain flexibility while also returning capital to shareholders.",
-            "question3": "how are you thinking about the competitive environment in California",
-            "answer3": "California is a dynamic market with strong demographics. We have advantages - our commercial expertise and now meaningful scale. Client feedback has been positive."
-        })
-    elif bank_id == "BNS":
-        qa_context.update({
-            "question1": "Can you provide more details on the timeline for exiting certain Latin American markets",
-            "answer1": "We're making good progress on announced transactions. We expect to close the majority by mid-year with some extending into the second half.",
-            "followup1": "how should we think about reinvesting that capital",
-            "followup_answer1": "Our priority is strengthening the balance sheet and investing in core markets. Canada and Mexico offer attractive opportunities.",
-            "question2": "Can you discuss credit trends in your Canadian retail portfolio",
-            "answer2": "Canadian retail credit remains in good shape. Delinquencies have normalized but are within historical ranges.",
-            "followup2": "Mexico credit outlook",
-            "followup_answer2": "Mexico PCLs are running higher than Canada but in line with expectations. Our through-the-cycle provisioning means we're comfortable with reserves.",
-            "question3": "your efficiency ratio remains above peers - what's the path to closing that gap",
-            "answer3": "Improving efficiency is a key priority. The international rationalization will help. We're also investing in automation and digitization."
-        })
-    elif bank_id == "CM":
-        qa_context.update({
-            "question1": "Your mortgage book continues to outperform - what's driving that",
-            "answer1": "A few factors. Conservative underwriting, concentration in urban markets with stronger fundamentals, and our portfolio mix skews toward lower LTV borrowers.",
-            "followup1": "market share in a potentially busier refinancing market",
-            "followup_answer1": "We're well positioned for increased activity. Our branch network and mobile origination tools are excellent.",
-            "question2": "Can you discuss the outlook for capital markets",
-            "answer2": "Our capital markets business is designed to be less volatile given our client focus. We're gaining share in advisory and our trading desk has invested in capabilities.",
-            "expense_question": "how should we think about the trajectory",
-            "expense_answer": "We're committed to positive operating leverage. We continue to invest in technology while achieving efficiencies in other areas.",
-            "question3": "do you see any M&A opportunities that make sense for CIBC",
-            "answer3": "We're very focused on organic growth. We don't feel we need M&A to compete effectively. We'd look at opportunities that strengthen our Canadian franchise."
-        })
-    elif bank_id == "NA":
-        qa_context.update({
-            "question1": "Can you provide an update on the Canadian Western Bank acquisition",
-            "answer1": "We're excited about this transaction. Regulatory approvals are progressing. CWB adds scale in Western Canada and diversifies our geographic exposure.",
-            "followup1": "What are the synergy expectations",
-            "followup_answer1": "We've identified meaningful cost synergies primarily in corporate functions and technology. Revenue synergies from product cross-sell are also mapped out.",
-            "question2": "Your ROE continues to lead the industry - what's sustainable going forward",
-            "answer2": "Our ROE reflects our leading Quebec position, efficient operations, and disciplined capital allocation. We see no reason that should change.",
-            "followup2": "on your geographic expansion, how do you compete outside Quebec",
-            "followup_answer2": "We're selective. We focus on commercial banking where relationships matter. We've had success winning clients who appreciate our service model.",
-            "question3": "can you discuss the competitive environment in Quebec",
-            "answer3": "Quebec remains our fortress. We have relationships going back generations. Competitors have tried to gain share with limited success."
-        })
+    qa_context.update(QA_CONTEXT_BY_BANK[bank_id])
 
-    qa_content = QA_TEMPLATES[bank_id].format(**qa_context)
+    qa_content = render_template(COMPILED_QA_TEMPLATES[bank_id], qa_context)
 
     return md_content, qa_content
 
 
+def write_json(path, payload):
+    """Write payload as 2-space indented JSON, using orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+
+
 def generate_all_data():
     """Generate all mock data files."""
-    random.seed(42)  # For reproducibility
+    rng = random.Random(42)  # Dedicated generator for reproducibility
 
     transcripts = []
     financials = []
     stock_prices = []
 
     for period_idx, period in enumerate(PERIODS):
-        for bank_id in BANKS:
+        fiscal_year = period["fiscal_year"]
+        fiscal_quarter = period["fiscal_quarter"]
+        call_date = period["call_date"]
+        period_end = period["period_end"]
+
+        for bank_id, bank in BANKS.items():
             # Generate metrics
-            metrics = generate_metrics(bank_id, period_idx)
+            metrics = generate_metrics(bank, period_idx, rng)
 
             # Generate transcripts
-            md_content, qa_content = generate_transcript_content(bank_id, period, metrics)
+            md_content, qa_content = generate_transcript_content(bank_id, bank, period_idx, metrics, rng)
             transcripts.append({
                 "bank_id": bank_id,
-                "fiscal_year": period["fiscal_year"],
-                "fiscal_quarter": period["fiscal_quarter"],
-                "call_date": period["call_date"],
+                "fiscal_year": fiscal_year,
+                "fiscal_quarter": fiscal_quarter,
+                "call_date": call_date,
                 "sections": {
                     "management_discussion": md_content,
                     "qa": qa_content
@@ -816,34 +876,31 @@ def generate_all_data():
             # Add to financials list
             financials.append({
                 "bank_id": bank_id,
-                "fiscal_year": period["fiscal_year"],
-                "fiscal_quarter": period["fiscal_quarter"],
+                "fiscal_year": fiscal_year,
+                "fiscal_quarter": fiscal_quarter,
                 "metrics": metrics
             })
 
             # Generate stock price
-            stock_data = generate_stock_price(bank_id, period_idx)
+            stock_data = generate_stock_price(bank, period_idx, rng)
             stock_prices.append({
                 "bank_id": bank_id,
-                "fiscal_year": period["fiscal_year"],
-                "fiscal_quarter": period["fiscal_quarter"],
-                "period_end_date": period["period_end"],
+                "fiscal_year": fiscal_year,
+                "fiscal_quarter": fiscal_quarter,
+                "period_end_date": period_end,
                 **stock_data
             })
 
     # Write files to data directory
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    with open(DATA_DIR / "transcripts.json", "w") as f:
-        json.dump(transcripts, f, indent=2)
+    write_json(DATA_DIR / "transcripts.json", transcripts)
     print(f"  Generated {len(transcripts)} transcript records")
 
-    with open(DATA_DIR / "financials.json", "w") as f:
-        json.dump(financials, f, indent=2)
+    write_json(DATA_DIR / "financials.json", financials)
     print(f"  Generated {len(financials)} financial records ({len(financials) * 25} metrics)")
 
-    with open(DATA_DIR / "stock_prices.json", "w") as f:
-        json.dump(stock_prices, f, indent=2)
+    write_json(DATA_DIR / "stock_prices.json", stock_prices)
     print(f"  Generated {len(stock_prices)} stock price records")
 
 
@@ -5,12 +5,19 @@ Loads mock data from JSON files into Postgres tables.
 Usage: python scripts/database/load_data.py
 """
 
+import csv
+import io
 import json
+import operator
 import os
 from pathlib import Path
 
 import psycopg2
-from psycopg2.extras import execute_values
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to stdlib json
+    orjson = None
 
 # Paths relative to this script
 SCRIPT_DIR = Path(__file__).parent
@@ -19,7 +26,13 @@ DATA_DIR = SCRIPT_DIR / "data"
 SCHEMAS_DIR = PROJECT_ROOT / "schemas"
 
 # Import metrics config from same directory
-from metrics import METRICS
+from metrics import METRIC_IDS, METRIC_NAMES, METRIC_UNITS
+
+# Pulls the (bank_id, fiscal_year, fiscal_quarter) key fields from a data item
+_period_key = operator.itemgetter("bank_id", "fiscal_year", "fiscal_quarter")
+
+# metric_id -> (display name, unit)
+METRIC_NAME_UNIT = dict(zip(METRIC_IDS, zip(METRIC_NAMES, METRIC_UNITS)))
 
 # Database config
 DB_CONFIG = {
@@ -33,11 +46,38 @@ if os.getenv("DB_PASSWORD"):
     DB_CONFIG["password"] = os.getenv("DB_PASSWORD")
 
 
+def read_json(filepath):
+    """Read a JSON data file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(filepath.read_bytes())
+    with open(filepath, "r") as f:
+        return json.load(f)
+
+
 def get_connection():
     """Get database connection."""
     return psycopg2.connect(**DB_CONFIG)
 
 
+def copy_records(cursor, table, columns, records):
+    """Bulk load rows into a freshly cleared table with COPY ... FROM STDIN.
+
+    Returns the number of rows written.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    count = 0
+    for record in records:
+        writer.writerow(record)
+        count += 1
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+        buffer,
+    )
+    return count
+
+
 def init_schema(conn):
     """Initialize database tables from SQL files."""
     cursor = conn.cursor()
@@ -53,81 +93,36 @@ def init_schema(conn):
     print("  Schema initialized successfully")
 
 
-def load_transcripts(conn):
-    """Load transcript data from JSON."""
-    filepath = DATA_DIR / "transcripts.json"
-
-    with open(filepath, "r") as f:
-        data = json.load(f)
-
-    cursor = conn.cursor()
-
-    # Clear existing data
-    cursor.execute("DELETE FROM transcripts")
-
-    records = []
+def iter_transcript_rows(data):
+    """Yield transcripts table rows, one per transcript section."""
     for item in data:
-        bank_id = item["bank_id"]
-        fiscal_year = item["fiscal_year"]
-        fiscal_quarter = item["fiscal_quarter"]
+        bank_id, fiscal_year, fiscal_quarter = _period_key(item)
         call_date = item["call_date"]
+        id_prefix = "_".join((bank_id, str(fiscal_year), fiscal_quarter))
 
         for section, content in item["sections"].items():
-            record_id = f"{bank_id}_{fiscal_year}_{fiscal_quarter}_{section}"
-            records.append((
-                record_id,
+            yield (
+                "_".join((id_prefix, section)),
                 bank_id,
                 fiscal_year,
                 fiscal_quarter,
                 section,
                 content,
                 call_date
-            ))
-
-    insert_sql = """
-        INSERT INTO transcripts (id, bank_id, fiscal_year, fiscal_quarter, section, content_text, call_date)
-        VALUES %s
-        ON CONFLICT (id) DO UPDATE SET
-            content_text = EXCLUDED.content_text,
-            call_date = EXCLUDED.call_date
-    """
-
-    execute_values(cursor, insert_sql, records)
-    conn.commit()
-    cursor.close()
-
-    print(f"  Loaded {len(records)} transcript records")
+            )
 
 
-def load_financials(conn):
-    """Load financial metrics data from JSON."""
-    filepath = DATA_DIR / "financials.json"
-
-    with open(filepath, "r") as f:
-        data = json.load(f)
-
-    # Build metric lookup
-    metric_lookup = {m["id"]: m for m in METRICS}
-
-    cursor = conn.cursor()
-
-    # Clear existing data
-    cursor.execute("DELETE FROM financials")
-
-    records = []
+def iter_financial_rows(data):
+    """Yield financials table rows, one per metric."""
     for item in data:
-        bank_id = item["bank_id"]
-        fiscal_year = item["fiscal_year"]
-        fiscal_quarter = item["fiscal_quarter"]
+        bank_id, fiscal_year, fiscal_quarter = _period_key(item)
+        id_prefix = "_".join((bank_id, str(fiscal_year), fiscal_quarter))
 
         for metric_id, metric_data in item["metrics"].items():
-            metric_def = metric_lookup.get(metric_id, {})
-            metric_name = metric_def.get("name", metric_id)
-            unit = metric_def.get("unit", "")
+            metric_name, unit = METRIC_NAME_UNIT.get(metric_id, (metric_id, ""))
 
-            record_id = f"{bank_id}_{fiscal_year}_{fiscal_quarter}_{metric_id}"
-            records.append((
-                record_id,
+            yield (
+                "_".join((id_prefix, metric_id)),
                 bank_id,
                 fiscal_year,
                 fiscal_quarter,
@@ -136,66 +131,83 @@ def load_financials(conn):
                 metric_data["value"],
                 unit,
                 metric_data["formatted"]
-            ))
-
-    insert_sql = """
-        INSERT INTO financials (id, bank_id, fiscal_year, fiscal_quarter, metric_id, metric_name, value, unit, formatted_value)
-        VALUES %s
-        ON CONFLICT (id) DO UPDATE SET
-            metric_name = EXCLUDED.metric_name,
-            value = EXCLUDED.value,
-            unit = EXCLUDED.unit,
-            formatted_value = EXCLUDED.formatted_value
-    """
+            )
 
-    execute_values(cursor, insert_sql, records)
-    conn.commit()
-    cursor.close()
 
-    print(f"  Loaded {len(records)} financial metric records")
+def iter_stock_price_rows(data):
+    """Yield stock_prices table rows, one per bank/period."""
+    for item in data:
+        bank_id, fiscal_year, fiscal_quarter = _period_key(item)
+        yield (
+            "_".join((bank_id, str(fiscal_year), fiscal_quarter)),
+            bank_id,
+            fiscal_year,
+            fiscal_quarter,
+            item["close_price"],
+            item["qoq_change_pct"],
+            item["yoy_change_pct"],
+            item["period_end_date"]
+        )
 
 
-def load_stock_prices(conn):
-    """Load stock price data from JSON."""
-    filepath = DATA_DIR / "stock_prices.json"
+def load_transcripts(cursor):
+    """Load transcript data from JSON."""
+    filepath = DATA_DIR / "transcripts.json"
 
-    with open(filepath, "r") as f:
-        data = json.load(f)
+    data = read_json(filepath)
 
-    cursor = conn.cursor()
+    # Clear existing data
+    cursor.execute("TRUNCATE TABLE transcripts")
+
+    # Table was just cleared, so rows can be streamed in without upserts
+    count = copy_records(
+        cursor,
+        "transcripts",
+        ("id", "bank_id", "fiscal_year", "fiscal_quarter", "section", "content_text", "call_date"),
+        iter_transcript_rows(data),
+    )
+
+    print(f"  Loaded {count} transcript records")
+
+
+def load_financials(cursor):
+    """Load financial metrics data from JSON."""
+    filepath = DATA_DIR / "financials.json"
+
+    data = read_json(filepath)
 
     # Clear existing data
-    cursor.execute("DELETE FROM stock_prices")
+    cursor.execute("TRUNCATE TABLE financials")
 
-    records = []
-    for item in data:
-        record_id = f"{item['bank_id']}_{item['fiscal_year']}_{item['fiscal_quarter']}"
-        records.append((
-            record_id,
-            item["bank_id"],
-            item["fiscal_year"],
-            item["fiscal_quarter"],
-            item["close_price"],
-            item["qoq_change_pct"],
-            item["yoy_change_pct"],
-            item["period_end_date"]
-        ))
-
-    insert_sql = """
-        INSERT INTO stock_prices (id, bank_id, fiscal_year, fiscal_quarter, close_price, qoq_change_pct, yoy_change_pct, period_end_date)
-        VALUES %s
-        ON CONFLICT (id) DO UPDATE SET
-            close_price = EXCLUDED.close_price,
-            qoq_change_pct = EXCLUDED.qoq_change_pct,
-            yoy_change_pct = EXCLUDED.yoy_change_pct,
-            period_end_date = EXCLUDED.period_end_date
-    """
+    # Table was just cleared, so rows can be streamed in without upserts
+    count = copy_records(
+        cursor,
+        "financials",
+        ("id", "bank_id", "fiscal_year", "fiscal_quarter", "metric_id", "metric_name", "value", "unit", "formatted_value"),
+        iter_financial_rows(data),
+    )
 
-    execute_values(cursor, insert_sql, records)
-    conn.commit()
-    cursor.close()
+    print(f"  Loaded {count} financial metric records")
+
+
+def load_stock_prices(cursor):
+    """Load stock price data from JSON."""
+    filepath = DATA_DIR / "stock_prices.json"
+
+    data = read_json(filepath)
+
+    # Clear existing data
+    cursor.execute("TRUNCATE TABLE stock_prices")
 
-    print(f"  Loaded {len(records)} stock price records")
+    # Table was just cleared, so rows can be streamed in without upserts
+    count = copy_records(
+        cursor,
+        "stock_prices",
+        ("id", "bank_id", "fiscal_year", "fiscal_quarter", "close_price", "qoq_change_pct", "yoy_change_pct", "period_end_date"),
+        iter_stock_price_rows(data),
+    )
+
+    print(f"  Loaded {count} stock price records")
 
 
 def verify_data(conn):
@@ -241,14 +253,24 @@ def main():
     print("\n2. Initializing schema...")
     init_schema(conn)
 
-    print("\n3. Loading transcripts...")
-    load_transcripts(conn)
-
-    print("\n4. Loading financials...")
-    load_financials(conn)
-
-    print("\n5. Loading stock prices...")
-    load_stock_prices(conn)
+    # All three loads share one cursor and commit together
+    cursor = conn.cursor()
+    try:
+        print("\n3. Loading transcripts...")
+        load_transcripts(cursor)
+
+        print("\n4. Loading financials...")
+        load_financials(cursor)
+
+        print("\n5. Loading stock prices...")
+        load_stock_prices(cursor)
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
 
     print("\n6. Verifying data...")
     verify_data(conn)
@@ -194,6 +194,11 @@ METRICS = [
     },
 ]
 
+# Column views of METRICS (same order) for lookups that need a single field
+METRIC_IDS = tuple(m["id"] for m in METRICS)
+METRIC_NAMES = tuple(m["name"] for m in METRICS)
+METRIC_UNITS = tuple(m["unit"] for m in METRICS)
+
 # Bank profiles for generating realistic mock data
 BANK_PROFILES = {
     "RY": {
@@ -8,12 +8,21 @@ import sys
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to stdlib json
+    orjson = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.db import get_connection
 
 
+# Enum options shared by every retrieval method
+BANK_IDS = ("RY", "TD", "BMO", "BNS", "CM", "NA")
+QUARTERS = ("Q1", "Q2", "Q3", "Q4")
+
 DATA_SOURCES = [
     {
         "id": "transcripts",
@@ -44,9 +53,9 @@ PERIODS AVAILABLE:
                 "description": "Get transcript section for a specific bank/quarter",
                 "mcp_tool": "search_transcripts",
                 "parameters": [
-                    {"key": "bank_id", "type": "enum", "options": ["RY", "TD", "BMO", "BNS", "CM", "NA"], "required": True, "prompt": "Which bank?"},
+                    {"key": "bank_id", "type": "enum", "options": list(BANK_IDS), "required": True, "prompt": "Which bank?"},
                     {"key": "fiscal_year", "type": "integer", "required": True, "prompt": "Which fiscal year?"},
-                    {"key": "fiscal_quarter", "type": "enum", "options": ["Q1", "Q2", "Q3", "Q4"], "required": True, "prompt": "Which quarter?"},
+                    {"key": "fiscal_quarter", "type": "enum", "options": list(QUARTERS), "required": True, "prompt": "Which quarter?"},
                     {"key": "section", "type": "enum", "options": ["management_discussion", "qa", "both"], "required": False, "default": "both", "prompt": "Which section?"}
                 ],
                 "returns": "Full transcript section text with metadata"
@@ -57,9 +66,9 @@ PERIODS AVAILABLE:
                 "description": "Get transcripts for multiple banks in the same quarter",
                 "mcp_tool": "search_transcripts",
                 "parameters": [
-                    {"key": "bank_ids", "type": "array", "items": {"type": "enum", "options": ["RY", "TD", "BMO", "BNS", "CM", "NA"]}, "required": True, "prompt": "Which banks to compare?"},
+                    {"key": "bank_ids", "type": "array", "items": {"type": "enum", "options": list(BANK_IDS)}, "required": True, "prompt": "Which banks to compare?"},
                     {"key": "fiscal_year", "type": "integer", "required": True, "prompt": "Which fiscal year?"},
-                    {"key": "fiscal_quarter", "type": "enum", "options": ["Q1", "Q2", "Q3", "Q4"], "required": True, "prompt": "Which quarter?"},
+                    {"key": "fiscal_quarter", "type": "enum", "options": list(QUARTERS), "required": True, "prompt": "Which quarter?"},
                     {"key": "section", "type": "enum", "options": ["management_discussion", "qa", "both"], "required": False, "default": "both"}
                 ],
                 "returns": "Transcripts for each bank"
@@ -111,9 +120,9 @@ PERIODS AVAILABLE:
                 "description": "Get financial metrics for a specific bank/quarter",
                 "mcp_tool": "search_financials",
                 "parameters": [
-                    {"key": "bank_id", "type": "enum", "options": ["RY", "TD", "BMO", "BNS", "CM", "NA"], "required": True, "prompt": "Which bank?"},
+                    {"key": "bank_id", "type": "enum", "options": list(BANK_IDS), "required": True, "prompt": "Which bank?"},
                     {"key": "fiscal_year", "type": "integer", "required": True, "prompt": "Which fiscal year?"},
-                    {"key": "fiscal_quarter", "type": "enum", "options": ["Q1", "Q2", "Q3", "Q4"], "required": True, "prompt": "Which quarter?"},
+                    {"key": "fiscal_quarter", "type": "enum", "options": list(QUARTERS), "required": True, "prompt": "Which quarter?"},
                     {"key": "metrics", "type": "array", "items": {"type": "string"}, "required": False, "prompt": "Which metrics? (leave empty for all 25)"}
                 ],
                 "returns": "Metric values with formatted display strings"
@@ -124,9 +133,9 @@ PERIODS AVAILABLE:
                 "description": "Compare financial metrics across multiple banks",
                 "mcp_tool": "search_financials",
                 "parameters": [
-                    {"key": "bank_ids", "type": "array", "items": {"type": "enum", "options": ["RY", "TD", "BMO", "BNS", "CM", "NA"]}, "required": True, "prompt": "Which banks to compare?"},
+                    {"key": "bank_ids", "type": "array", "items": {"type": "enum", "options": list(BANK_IDS)}, "required": True, "prompt": "Which banks to compare?"},
                     {"key": "fiscal_year", "type": "integer", "required": True, "prompt": "Which fiscal year?"},
-                    {"key": "fiscal_quarter", "type": "enum", "options": ["Q1", "Q2", "Q3", "Q4"], "required": True, "prompt": "Which quarter?"},
+                    {"key": "fiscal_quarter", "type": "enum", "options": list(QUARTERS), "required": True, "prompt": "Which quarter?"},
                     {"key": "metrics", "type": "array", "items": {"type": "string"}, "required": False}
                 ],
                 "returns": "Metrics for each bank for comparison"
@@ -164,9 +173,9 @@ PERIODS AVAILABLE:
                 "description": "Get stock price for a specific bank/quarter",
                 "mcp_tool": "search_stock_prices",
                 "parameters": [
-                    {"key": "bank_id", "type": "enum", "options": ["RY", "TD", "BMO", "BNS", "CM", "NA"], "required": True, "prompt": "Which bank?"},
+                    {"key": "bank_id", "type": "enum", "options": list(BANK_IDS), "required": True, "prompt": "Which bank?"},
                     {"key": "fiscal_year", "type": "integer", "required": True, "prompt": "Which fiscal year?"},
-                    {"key": "fiscal_quarter", "type": "enum", "options": ["Q1", "Q2", "Q3", "Q4"], "required": True, "prompt": "Which quarter?"}
+                    {"key": "fiscal_quarter", "type": "enum", "options": list(QUARTERS), "required": True, "prompt": "Which quarter?"}
                 ],
                 "returns": "Stock price with QoQ and YoY changes"
             },
@@ -176,9 +185,9 @@ PERIODS AVAILABLE:
                 "description": "Compare stock performance across multiple banks",
                 "mcp_tool": "search_stock_prices",
                 "parameters": [
-                    {"key": "bank_ids", "type": "array", "items": {"type": "enum", "options": ["RY", "TD", "BMO", "BNS", "CM", "NA"]}, "required": True, "prompt": "Which banks to compare?"},
+                    {"key": "bank_ids", "type": "array", "items": {"type": "enum", "options": list(BANK_IDS)}, "required": True, "prompt": "Which banks to compare?"},
                     {"key": "fiscal_year", "type": "integer", "required": True, "prompt": "Which fiscal year?"},
-                    {"key": "fiscal_quarter", "type": "enum", "options": ["Q1", "Q2", "Q3", "Q4"], "required": True, "prompt": "Which quarter?"}
+                    {"key": "fiscal_quarter", "type": "enum", "options": list(QUARTERS), "required": True, "prompt": "Which quarter?"}
                 ],
                 "returns": "Stock prices for each bank"
             },
@@ -188,7 +197,7 @@ PERIODS AVAILABLE:
                 "description": "Get stock price trend over multiple quarters",
                 "mcp_tool": "search_stock_prices",
                 "parameters": [
-                    {"key": "bank_id", "type": "enum", "options": ["RY", "TD", "BMO", "BNS", "CM", "NA"], "required": True, "prompt": "Which bank?"},
+                    {"key": "bank_id", "type": "enum", "options": list(BANK_IDS), "required": True, "prompt": "Which bank?"},
                     {"key": "periods", "type": "array", "items": {"type": "object", "properties": {"fiscal_year": {"type": "integer"}, "fiscal_quarter": {"type": "string"}}}, "required": True, "prompt": "Which periods?"}
                 ],
                 "returns": "Stock prices across specified periods"
@@ -199,55 +208,100 @@ PERIODS AVAILABLE:
 ]
 
 
-def seed_registry():
+REGISTRY_COLUMNS = ("id", "name", "description", "category", "retrieval_methods", "suggested_widgets")
+
+UPSERT_CONFLICT_SQL = """
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        description = EXCLUDED.description,
+        category = EXCLUDED.category,
+        retrieval_methods = EXCLUDED.retrieval_methods,
+        suggested_widgets = EXCLUDED.suggested_widgets,
+        updated_at = NOW()
+    WHERE data_source_registry.name IS DISTINCT FROM EXCLUDED.name
+       OR data_source_registry.description IS DISTINCT FROM EXCLUDED.description
+       OR data_source_registry.category IS DISTINCT FROM EXCLUDED.category
+       OR data_source_registry.retrieval_methods IS DISTINCT FROM EXCLUDED.retrieval_methods
+       OR data_source_registry.suggested_widgets IS DISTINCT FROM EXCLUDED.suggested_widgets
+"""
+
+
+def dump_json(value):
+    """Serialize a JSON column compactly, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"))
+
+
+def build_upsert(rows):
+    """Build one multi-row upsert statement and its flattened params."""
+    row_placeholder = "(" + ", ".join(["%s"] * len(REGISTRY_COLUMNS)) + ")"
+    sql = (
+        f"INSERT INTO data_source_registry ({', '.join(REGISTRY_COLUMNS)})\n"
+        f"    VALUES {', '.join([row_placeholder] * len(rows))}"
+        f"{UPSERT_CONFLICT_SQL}"
+    )
+    params = tuple(value for row in rows for value in row)
+    return sql, params
+
+
+def seed_registry(conn):
     """Seed the data_source_registry table."""
-    conn = get_connection()
+    # Serialize every row up front so the single upsert below only does DB work
+    rows = [
+        (
+            source["id"],
+            source["name"],
+            source["description"],
+            source["category"],
+            dump_json(source["retrieval_methods"]),
+            dump_json(source["suggested_widgets"])
+        )
+        for source in DATA_SOURCES
+    ]
+
     try:
         with conn.cursor() as cur:
-            for source in DATA_SOURCES:
-                cur.execute("""
-                    INSERT INTO data_source_registry (id, name, description, category, retrieval_methods, suggested_widgets)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (id) DO UPDATE SET
-                        name = EXCLUDED.name,
-                        description = EXCLUDED.description,
-                        category = EXCLUDED.category,
-                        retrieval_methods = EXCLUDED.retrieval_methods,
-                        suggested_widgets = EXCLUDED.suggested_widgets,
-                        updated_at = NOW()
-                """, (
-                    source["id"],
-                    source["name"],
-                    source["description"],
-                    source["category"],
-                    json.dumps(source["retrieval_methods"]),
-                    json.dumps(source["suggested_widgets"])
-                ))
-                print(f"  Seeded: {source['id']}")
-
-            conn.commit()
-            print(f"\nSeeded {len(DATA_SOURCES)} data sources")
+            # Single statement: one round trip regardless of source count
+            cur.execute(*build_upsert(rows))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
 
-    finally:
-        conn.close()
+    # Imported here: src/db.py execs this module during bootstrap for DATA_SOURCES
+    from src.workspace.data_sources import clear_data_source_cache
+
+    # Registry reads in this process see the new rows immediately; a running
+    # server picks them up once its cached reads expire (DATA_SOURCE_CACHE_TTL_SECONDS)
+    clear_data_source_cache()
+
+    # One buffered write instead of a flush per source
+    seeded = "".join(f"  Seeded: {source['id']}\n" for source in DATA_SOURCES)
+    sys.stdout.write(f"{seeded}\nSeeded {len(DATA_SOURCES)} data sources\n")
 
 
-def verify_registry():
+def verify_registry(conn):
     """Verify the registry was seeded correctly."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT id, name, category FROM data_source_registry ORDER BY id")
+        rows = cur.fetchall()
+        print("\nData Source Registry:")
+        print("-" * 50)
+        for row in rows:
+            print(f"  {row[0]}: {row[1]} ({row[2]})")
+
+
+def main():
+    print("Seeding data_source_registry...")
+    # Seeding and verification share one connection
     conn = get_connection()
     try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT id, name, category FROM data_source_registry ORDER BY id")
-            rows = cur.fetchall()
-            print("\nData Source Registry:")
-            print("-" * 50)
-            for row in rows:
-                print(f"  {row[0]}: {row[1]} ({row[2]})")
+        seed_registry(conn)
+        verify_registry(conn)
     finally:
         conn.close()
 
 
 if __name__ == "__main__":
-    print("Seeding data_source_registry...")
-    seed_registry()
-    verify_registry()
+    main()
@@ -6,7 +6,6 @@ Run from project root: python scripts/test/test_retrievers.py
 """
 
 import sys
-import json
 from pathlib import Path
 
 # Add src to path
@@ -18,6 +18,7 @@ from src.workspace.subsections import (
     configure_subsection, save_subsection_version
 )
 from src.workspace.data_sources import get_data_sources
+from src.workspace import workspace_transaction
 
 
 def test_data_sources():
@@ -125,13 +126,10 @@ def test_section_crud(template_id: str):
     assert len(section2["subsections"]) == 1
     print("   [PASS]")
 
-    # Get sections
-    print("\n3. Get sections:")
-    sections = get_sections(template_id)
-    print(f"   Found {len(sections)} section(s)")
-    for s in sections:
-        print(f"   - Position {s['position']}: {s['title']} ({len(s['subsections'])} subsections)")
-    assert len(sections) == 2
+    # Section count comes back with the mutation
+    print("\n3. Check section count:")
+    print(f"   Template has {section2['section_count']} section(s)")
+    assert section2["section_count"] == 2
     print("   [PASS]")
 
     # Update section
@@ -148,9 +146,8 @@ def test_section_crud(template_id: str):
     print("\n5. Delete section:")
     result = delete_section(section_id=section2["id"])
     print(f"   Deleted: {result['deleted']}")
-    sections = get_sections(template_id)
-    assert len(sections) == 1
-    print(f"   Remaining sections: {len(sections)}")
+    assert result["section_count"] == 1
+    print(f"   Remaining sections: {result['section_count']}")
     print("   [PASS]")
 
     return section1_id, subsection1_id
@@ -171,93 +168,95 @@ def test_subsection_operations(subsection_id: str):
     print(f"   Versions in history: {len(subsection.get('versions', []))}")
     print("   [PASS]")
 
-    # Update notes
-    print("\n2. Update notes:")
-    result = update_notes(
-        subsection_id=subsection_id,
-        notes="User prefers executive-friendly tone. Focus on key insights."
-    )
-    print(f"   Notes updated: {result['updated']}")
-    print(f"   Notes preview: {result['notes'][:50]}...")
-    assert result["updated"]
-    assert result["version_number"] == starting_version + 1
-    print("   [PASS]")
-
-    # Append to notes
-    print("\n3. Append to notes:")
-    result = update_notes(
-        subsection_id=subsection_id,
-        notes="Tried bullet points - user approved.",
-        append=True
-    )
-    print(f"   Notes now: {len(result['notes'])} chars")
-    assert "bullet points" in result["notes"]
-    assert result["version_number"] == starting_version + 2
-    print("   [PASS]")
-
-    # Update instructions
-    print("\n4. Update instructions:")
-    result = update_instructions(
-        subsection_id=subsection_id,
-        instructions="""Generate an executive summary with:
+    # Steps 2-7 run on one connection and commit once
+    with workspace_transaction():
+        # Update notes
+        print("\n2. Update notes:")
+        result = update_notes(
+            subsection_id=subsection_id,
+            notes="User prefers executive-friendly tone. Focus on key insights."
+        )
+        print(f"   Notes updated: {result['updated']}")
+        print(f"   Notes preview: {result['notes'][:50]}...")
+        assert result["updated"]
+        assert result["version_number"] == starting_version + 1
+        print("   [PASS]")
+
+        # Append to notes
+        print("\n3. Append to notes:")
+        result = update_notes(
+            subsection_id=subsection_id,
+            notes="Tried bullet points - user approved.",
+            append=True
+        )
+        print(f"   Notes now: {len(result['notes'])} chars")
+        assert "bullet points" in result["notes"]
+        assert result["version_number"] == starting_version + 2
+        print("   [PASS]")
+
+        # Update instructions
+        print("\n4. Update instructions:")
+        result = update_instructions(
+            subsection_id=subsection_id,
+            instructions="""Generate an executive summary with:
 - 3-4 key bullet points highlighting main trends
 - Focus on RY and TD performance
 - Include QoQ comparisons
 - Keep tone professional but accessible"""
-    )
-    print(f"   Instructions updated: {result['updated']}")
-    assert result["version_number"] == starting_version + 3
-    print("   [PASS]")
-
-    # Configure subsection
-    print("\n5. Configure subsection (data source + widget):")
-    result = configure_subsection(
-        subsection_id=subsection_id,
-        widget_type="key_points",
-        data_source_config={
-            "inputs": [
-                {
-                    "source_id": "financials",
-                    "method_id": "compare_banks",
-                    "parameters": {
-                        "bank_ids": ["RY", "TD"],
-                        "fiscal_year": 2025,
-                        "fiscal_quarter": "Q1",
-                        "metrics": ["net_income", "roe", "cet1_ratio"]
+        )
+        print(f"   Instructions updated: {result['updated']}")
+        assert result["version_number"] == starting_version + 3
+        print("   [PASS]")
+
+        # Configure subsection
+        print("\n5. Configure subsection (data source + widget):")
+        result = configure_subsection(
+            subsection_id=subsection_id,
+            widget_type="key_points",
+            data_source_config={
+                "inputs": [
+                    {
+                        "source_id": "financials",
+                        "method_id": "compare_banks",
+                        "parameters": {
+                            "bank_ids": ["RY", "TD"],
+                            "fiscal_year": 2025,
+                            "fiscal_quarter": "Q1",
+                            "metrics": ["net_income", "roe", "cet1_ratio"]
+                        }
                     }
-                }
-            ]
-        }
-    )
-    print(f"   Widget type: {result['widget_type']}")
-    print(f"   Data source: {result['data_source_config']['inputs'][0]['source_id']}")
-    assert result["widget_type"] == "key_points"
-    print("   [PASS]")
-
-    # Save content version
-    print("\n6. Save subsection version:")
-    version = save_subsection_version(
-        subsection_id=subsection_id,
-        content="""## Q1 2025 Executive Summary
+                ]
+            }
+        )
+        print(f"   Widget type: {result['widget_type']}")
+        print(f"   Data source: {result['data_source_config']['inputs'][0]['source_id']}")
+        assert result["widget_type"] == "key_points"
+        print("   [PASS]")
+
+        # Save content version
+        print("\n6. Save subsection version:")
+        version = save_subsection_version(
+            subsection_id=subsection_id,
+            content="""## Q1 2025 Executive Summary
 
 - **RY**: Net income of $4.2B (+5% QoQ), ROE at 16.2%
 - **TD**: Net income of $3.8B (-2% QoQ), ROE at 14.8%
 - Both banks maintaining strong CET1 ratios above 12%
 - Market conditions remain favorable for Canadian banking sector""",
-        content_type="markdown",
-        generated_by="agent",
-        generation_context={"data_sources_used": ["financials"]}
-    )
-    print(f"   Created version {version['version_number']}")
-    print(f"   Generated by: {version['generated_by']}")
-    assert version["version_number"] == starting_version + 4
-    print("   [PASS]")
-
-    # Save another version (iteration)
-    print("\n7. Save revised version:")
-    version2 = save_subsection_version(
-        subsection_id=subsection_id,
-        content="""## Q1 2025 Executive Summary
+            content_type="markdown",
+            generated_by="agent",
+            generation_context={"data_sources_used": ["financials"]}
+        )
+        print(f"   Created version {version['version_number']}")
+        print(f"   Generated by: {version['generated_by']}")
+        assert version["version_number"] == starting_version + 4
+        print("   [PASS]")
+
+        # Save another version (iteration)
+        print("\n7. Save revised version:")
+        version2 = save_subsection_version(
+            subsection_id=subsection_id,
+            content="""## Q1 2025 Executive Summary
 
 **Key Highlights:**
 
@@ -267,12 +266,12 @@ def test_subsection_operations(subsection_id: str):
   - ROE: 14.8% | CET1: 12.5%
 
 Both banks continue to demonstrate resilience with capital ratios well above regulatory requirements.""",
-        content_type="markdown",
-        generated_by="agent",
-    )
-    print(f"   Created version {version2['version_number']}")
-    assert version2["version_number"] == starting_version + 5
-    print("   [PASS]")
+            content_type="markdown",
+            generated_by="agent",
+        )
+        print(f"   Created version {version2['version_number']}")
+        assert version2["version_number"] == starting_version + 5
+        print("   [PASS]")
 
     # Verify version history
     print("\n8. Verify version history:")
@@ -306,49 +305,51 @@ def test_full_workflow():
     sources = get_data_sources()
     print(f"\n1. Available data sources: {[s['id'] for s in sources]}")
 
-    # 2. Create template
-    template = create_template(
-        name="Big 6 Banks Q1 2025 Analysis",
-        created_by="analyst",
-        description="Quarterly analysis of Canadian Big 6 banks"
-    )
-    print(f"2. Created template: {template['name']}")
-
-    # 3. Add sections
-    section = create_section(
-        template_id=template["id"],
-        title="Financial Overview"
-    )
-    print(f"3. Created section: {section['title']} with {len(section['subsections'])} subsections")
-
-    # 4. Configure subsection
-    main_subsection = section["subsections"][0]
-    configure_subsection(
-        subsection_id=main_subsection["id"],
-        widget_type="table",
-        data_source_config={
-            "inputs": [
-                {
-                    "source_id": "financials",
-                    "method_id": "compare_banks",
-                    "parameters": {
-                        "bank_ids": ["RY", "TD", "BMO", "BNS", "CM", "NA"],
-                        "fiscal_year": 2025,
-                        "fiscal_quarter": "Q1",
-                        "metrics": ["net_income", "roe", "cet1_ratio"]
+    # 2-4 share one transaction: a single commit instead of one per call
+    with workspace_transaction():
+        # 2. Create template
+        template = create_template(
+            name="Big 6 Banks Q1 2025 Analysis",
+            created_by="analyst",
+            description="Quarterly analysis of Canadian Big 6 banks"
+        )
+        print(f"2. Created template: {template['name']}")
+
+        # 3. Add sections
+        section = create_section(
+            template_id=template["id"],
+            title="Financial Overview"
+        )
+        print(f"3. Created section: {section['title']} with {len(section['subsections'])} subsections")
+
+        # 4. Configure subsection
+        main_subsection = section["subsections"][0]
+        configure_subsection(
+            subsection_id=main_subsection["id"],
+            widget_type="table",
+            data_source_config={
+                "inputs": [
+                    {
+                        "source_id": "financials",
+                        "method_id": "compare_banks",
+                        "parameters": {
+                            "bank_ids": ["RY", "TD", "BMO", "BNS", "CM", "NA"],
+                            "fiscal_year": 2025,
+                            "fiscal_quarter": "Q1",
+                            "metrics": ["net_income", "roe", "cet1_ratio"]
+                        }
                     }
-                }
-            ]
-        }
-    )
-    update_notes(
-        subsection_id=main_subsection["id"],
-        notes="Display as comparison table. Highlight top performer in each metric."
-    )
-    update_instructions(
-        subsection_id=main_subsection["id"],
-        instructions="Create a comparison table of key metrics for all Big 6 banks. Include net income, ROE, and CET1 ratio."
-    )
+                ]
+            }
+        )
+        update_notes(
+            subsection_id=main_subsection["id"],
+            notes="Display as comparison table. Highlight top performer in each metric."
+        )
+        update_instructions(
+            subsection_id=main_subsection["id"],
+            instructions="Create a comparison table of key metrics for all Big 6 banks. Include net income, ROE, and CET1 ratio."
+        )
 
     print("4. Configured subsection")
 
@@ -377,14 +378,14 @@ def cleanup_test_templates():
     conn = get_connection()
     try:
         with conn.cursor() as cur:
+            # Only the count is reported, so skip RETURNING and use rowcount
             cur.execute("""
                 DELETE FROM templates
                 WHERE created_by IN ('test_user', 'analyst')
-                RETURNING id, name
             """)
-            deleted = cur.fetchall()
+            deleted_count = cur.rowcount
             conn.commit()
-            print(f"   Deleted {len(deleted)} test template(s)")
+            print(f"   Deleted {deleted_count} test template(s)")
     finally:
         conn.close()
 
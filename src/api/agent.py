@@ -7,11 +7,20 @@ Handles:
 - Executing the tool-calling loop
 """
 
+import hashlib
 import json
+import math
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Callable
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to stdlib json
+    orjson = None
+
 # Import all workspace functions and tool definitions
 from ..workspace import (
     # Templates
@@ -39,6 +48,7 @@ from ..workspace import (
     SUBSECTION_TOOLS,
     # Data sources
     get_data_sources,
+    get_data_source_lookups,
     DATA_SOURCES_TOOL,
     # Conversations
     get_or_create_conversation,
@@ -64,15 +74,11 @@ from ..uploads import (
     get_upload_content,
     TOOL_DEFINITION as UPLOADS_TOOL,
 )
-from ..infra.llm import get_openai_client, resolve_chat_runtime
+from ..infra.llm import get_chat_runtime, get_shared_openai_client
 
 # Configuration
-OPENAI_MODEL, OPENAI_MAX_TOKENS, _OPENAI_AUTH_MODE = resolve_chat_runtime()
 MAX_TOOL_ITERATIONS = 10
 
-# Initialize OpenAI client via centralized auth resolution.
-client = get_openai_client()
-
 
 # ============================================================
 # Tool Registry
@@ -111,13 +117,92 @@ TOOL_REGISTRY: dict[str, Callable] = {
 }
 
 
-STRUCTURE_MUTATION_TOOLS = {
+# Integers with 19+ digits may exceed 64 bits, which orjson parses as lossy floats
+_LONG_DIGIT_RUN_PATTERN = re.compile(r"\d{19}")
+
+
+def _loads_tool_arguments(raw: str) -> Any:
+    """
+    Parse a tool call's JSON arguments, using orjson when available.
+
+    Payloads that may hold integers beyond 64 bits go through the stdlib
+    parser, which keeps them exact.
+    """
+    if orjson is not None and not (
+        isinstance(raw, str) and _LONG_DIGIT_RUN_PATTERN.search(raw)
+    ):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity tokens, which the stdlib parser accepts
+    return json.loads(raw)
+
+
+def _contains_non_finite_float(value: Any) -> bool:
+    """Return True when a JSON-like value holds NaN or +/-Infinity anywhere."""
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, float):
+            if not math.isfinite(node):
+                return True
+        elif isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return False
+
+
+def _dumps_tool_result(result: Any) -> str:
+    """Encode a tool result for the model; unknown types fall back to str()."""
+    if orjson is not None:
+        try:
+            # Datetimes and dataclasses go through str() like the stdlib path
+            encoded = orjson.dumps(
+                result,
+                default=str,
+                option=(
+                    orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                ),
+            )
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles them
+        else:
+            # orjson writes NaN/Infinity as null; only then is a scan needed
+            if b"null" not in encoded or not _contains_non_finite_float(result):
+                return encoded.decode()
+    return json.dumps(result, default=str)
+
+
+# Read-only retrievers over static bank data; safe to run ahead of other calls
+PARALLEL_RETRIEVAL_TOOLS = frozenset({
+    "search_transcripts",
+    "search_financials",
+    "search_stock_prices",
+})
+
+_RETRIEVAL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agent-retrieval")
+
+
+STRUCTURE_MUTATION_TOOLS = frozenset({
     "create_section",
     "delete_section",
     "create_subsection",
     "delete_subsection",
     "reorder_subsection",
-}
+})
+
+
+def _canonical_tool_arguments(arguments: dict[str, Any]) -> bytes:
+    """Encode arguments with sorted keys, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(arguments, default=str, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(arguments, sort_keys=True, default=str).encode()
 
 
 def _build_tool_signature(tool_name: str, arguments: dict[str, Any]) -> str:
@@ -125,32 +210,48 @@ def _build_tool_signature(tool_name: str, arguments: dict[str, Any]) -> str:
     Build a deterministic signature for de-duplicating tool calls.
 
     The agent occasionally emits repeated configure_subsection calls with
-    identical payloads in a single chat turn. We use a canonical JSON encoding
-    of the arguments to detect those duplicates.
+    identical payloads in a single chat turn. We hash a canonical JSON encoding
+    of the arguments to detect those duplicates, so the dedup set holds
+    fixed-size digests rather than whole payloads.
     """
-    canonical_args = json.dumps(arguments, sort_keys=True, default=str)
-    return f"{tool_name}:{canonical_args}"
+    digest = hashlib.blake2b(_canonical_tool_arguments(arguments), digest_size=16).hexdigest()
+    return f"{tool_name}:{digest}"
+
+
+# Deletes every ASCII character that is not a letter or digit
+_ASCII_NON_ALNUM_TABLE = {
+    code: None for code in range(128) if not chr(code).isalnum()
+}
 
 
 def _normalize_reference_token(value: str) -> str:
     """Normalize free-form reference tokens (e.g., 'S1-A', 'section 1')."""
+    if value.isascii():
+        return value.lower().translate(_ASCII_NON_ALNUM_TABLE)
     return "".join(ch for ch in value.strip().lower() if ch.isalnum())
 
 
-def _build_reference_maps(template_id: str) -> tuple[dict[str, str], dict[str, str]]:
+def _build_reference_maps(
+    template_id: str,
+) -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
     """
-    Build alias -> UUID maps for section/subsection references.
+    Build alias -> UUID maps and a canonical UUID -> ref map for sections/subsections.
 
     Supported aliases include:
     - Sections: 1, S1, section1
     - Subsections: 1A, S1A, S1.1, subsection1A
+
+    Returns:
+        (section_reference_map, subsection_reference_map, id_to_ref)
     """
     section_reference_map: dict[str, str] = {}
     subsection_reference_map: dict[str, str] = {}
+    # Section and subsection ids come from different tables, so one map covers both
+    id_to_ref: dict[str, str] = {}
 
     sections = get_sections(template_id, include_content=False)
     if not isinstance(sections, list):
-        return section_reference_map, subsection_reference_map
+        return section_reference_map, subsection_reference_map, id_to_ref
 
     sorted_sections = sorted(
         (section for section in sections if isinstance(section, dict)),
@@ -165,13 +266,11 @@ def _build_reference_maps(template_id: str) -> tuple[dict[str, str], dict[str, s
         if not isinstance(section_position, int) or section_position < 1:
             continue
 
-        section_aliases = [
-            str(section_position),
-            f"s{section_position}",
-            f"section{section_position}",
-        ]
-        for alias in section_aliases:
-            section_reference_map[_normalize_reference_token(alias)] = section_id
+        # Aliases are written in _normalize_reference_token's output form
+        section_reference_map[str(section_position)] = section_id
+        section_reference_map[f"s{section_position}"] = section_id
+        section_reference_map[f"section{section_position}"] = section_id
+        id_to_ref[section_id] = f"S{section_position}"
 
         subsections = section.get("subsections")
         if not isinstance(subsections, list):
@@ -189,94 +288,64 @@ def _build_reference_maps(template_id: str) -> tuple[dict[str, str], dict[str, s
             if not isinstance(subsection_position, int) or subsection_position < 1:
                 continue
 
-            label = (
-                chr(64 + subsection_position)
-                if 1 <= subsection_position <= 26
-                else str(subsection_position)
-            )
-            subsection_aliases = [
-                f"{section_position}{label}",
-                f"s{section_position}{label}",
-                f"s{section_position}.{subsection_position}",
-                f"subsection{section_position}{label}",
-            ]
-            for alias in subsection_aliases:
-                subsection_reference_map[_normalize_reference_token(alias)] = subsection_id
-
-    return section_reference_map, subsection_reference_map
-
-
-def _build_primary_id_to_ref_maps(
-    section_reference_map: dict[str, str],
-    subsection_reference_map: dict[str, str],
-) -> tuple[dict[str, str], dict[str, str]]:
-    """Build canonical UUID -> reference maps (e.g., uuid -> S1 / S1A)."""
-    section_id_to_ref: dict[str, str] = {}
-    subsection_id_to_ref: dict[str, str] = {}
-
-    for alias, section_id in section_reference_map.items():
-        if not isinstance(alias, str) or not isinstance(section_id, str):
-            continue
-        if not re.fullmatch(r"s\d+", alias):
-            continue
-        section_id_to_ref[section_id] = alias.upper()
-
-    for alias, subsection_id in subsection_reference_map.items():
-        if not isinstance(alias, str) or not isinstance(subsection_id, str):
-            continue
-        if not re.fullmatch(r"s\d+[a-z]+", alias):
-            continue
-        subsection_id_to_ref[subsection_id] = alias.upper()
+            has_letter_label = 1 <= subsection_position <= 26
+            label = chr(64 + subsection_position) if has_letter_label else str(subsection_position)
+            token_label = label.lower()
+            subsection_reference_map[f"{section_position}{token_label}"] = subsection_id
+            subsection_reference_map[f"s{section_position}{token_label}"] = subsection_id
+            # S1.1 normalizes to s11
+            subsection_reference_map[f"s{section_position}{subsection_position}"] = subsection_id
+            subsection_reference_map[f"subsection{section_position}{token_label}"] = subsection_id
+            # Only letter labels give an unambiguous compact ref (S1A); S127 could
+            # equally be a section, so those subsections keep their UUID.
+            if has_letter_label:
+                id_to_ref[subsection_id] = f"S{section_position}{label}"
 
-    return section_id_to_ref, subsection_id_to_ref
+    return section_reference_map, subsection_reference_map, id_to_ref
 
 
 def _sanitize_tool_result_for_model(
     value: Any,
-    section_id_to_ref: dict[str, str],
-    subsection_id_to_ref: dict[str, str],
+    id_to_ref: dict[str, str],
 ) -> Any:
     """
     Replace known UUIDs with compact refs in tool-result messages sent back to the model.
 
     This nudges the model to keep using short refs in subsequent tool calls, which
     improves reliability and token efficiency.
+
+    Containers without a replacement are returned as-is rather than copied.
     """
-    if isinstance(value, str):
-        if value in subsection_id_to_ref:
-            return subsection_id_to_ref[value]
-        if value in section_id_to_ref:
-            return section_id_to_ref[value]
+    if not id_to_ref:
         return value
 
-    if isinstance(value, list):
-        return [
-            _sanitize_tool_result_for_model(item, section_id_to_ref, subsection_id_to_ref)
-            for item in value
-        ]
-
-    if isinstance(value, dict):
-        sanitized: dict[str, Any] = {}
-        for key, item in value.items():
-            if key in {"section_id", "id"} and isinstance(item, str):
-                if item in section_id_to_ref:
-                    sanitized[key] = section_id_to_ref[item]
-                    continue
-                if item in subsection_id_to_ref:
-                    sanitized[key] = subsection_id_to_ref[item]
-                    continue
-            if key == "subsection_id" and isinstance(item, str):
-                if item in subsection_id_to_ref:
-                    sanitized[key] = subsection_id_to_ref[item]
-                    continue
-            sanitized[key] = _sanitize_tool_result_for_model(
-                item,
-                section_id_to_ref,
-                subsection_id_to_ref,
-            )
-        return sanitized
+    def replace(node: Any) -> Any:
+        if isinstance(node, str):
+            return id_to_ref.get(node, node)
 
-    return value
+        if isinstance(node, list):
+            replaced_list: list[Any] | None = None
+            for index, item in enumerate(node):
+                new_item = replace(item)
+                if new_item is not item:
+                    if replaced_list is None:
+                        replaced_list = list(node)
+                    replaced_list[index] = new_item
+            return node if replaced_list is None else replaced_list
+
+        if isinstance(node, dict):
+            replaced_dict: dict[str, Any] | None = None
+            for key, item in node.items():
+                new_item = replace(item)
+                if new_item is not item:
+                    if replaced_dict is None:
+                        replaced_dict = dict(node)
+                    replaced_dict[key] = new_item
+            return node if replaced_dict is None else replaced_dict
+
+        return node
+
+    return replace(value)
 
 
 def _resolve_reference_value(value: Any, reference_map: dict[str, str]) -> Any:
@@ -294,8 +363,13 @@ def _normalize_tool_references(
     section_reference_map: dict[str, str],
     subsection_reference_map: dict[str, str],
 ) -> dict[str, Any]:
-    """Normalize section/subsection identifiers in tool arguments."""
-    normalized = deepcopy(arguments)
+    """
+    Normalize section/subsection identifiers in tool arguments.
+
+    Only the containers that get rewritten are copied, so the caller's
+    arguments are never mutated.
+    """
+    normalized = dict(arguments)
 
     if "section_id" in normalized:
         normalized["section_id"] = _resolve_reference_value(
@@ -311,8 +385,10 @@ def _normalize_tool_references(
 
     data_source_config = normalized.get("data_source_config")
     if isinstance(data_source_config, dict):
+        data_source_config = dict(data_source_config)
         dependencies = data_source_config.get("dependencies")
         if isinstance(dependencies, dict):
+            dependencies = dict(dependencies)
             section_ids = dependencies.get("section_ids")
             if isinstance(section_ids, list):
                 dependencies["section_ids"] = [
@@ -331,32 +407,8 @@ def _normalize_tool_references(
     return normalized
 
 
-def _method_id_from_definition(method_definition: dict[str, Any]) -> str | None:
-    """Read a retrieval method identifier from registry definition variants."""
-    if not isinstance(method_definition, dict):
-        return None
-    method_id = method_definition.get("method_id") or method_definition.get("id")
-    return method_id if isinstance(method_id, str) and method_id else None
-
-
-def _parameter_keys_from_method(method_definition: dict[str, Any]) -> set[str]:
-    """Get parameter keys declared by a retrieval method schema."""
-    keys: set[str] = set()
-    parameters = method_definition.get("parameters")
-    if not isinstance(parameters, list):
-        return keys
-
-    for parameter in parameters:
-        if not isinstance(parameter, dict):
-            continue
-        key = parameter.get("key") or parameter.get("name")
-        if isinstance(key, str) and key:
-            keys.add(key)
-    return keys
-
-
 def _choose_method_from_mcp_tool(
-    method_definitions: list[dict[str, Any]],
+    methods_by_mcp_tool: dict[str, list[tuple[str | None, frozenset[str]]]],
     mcp_tool_name: str,
     parameters: dict[str, Any] | None,
 ) -> str | None:
@@ -366,51 +418,40 @@ def _choose_method_from_mcp_tool(
     Example:
       method_id: "search_transcripts" -> by_quarter / compare_banks
     """
-    lowered_mcp_tool = mcp_tool_name.strip().lower()
-    matches: list[dict[str, Any]] = []
-    for method_definition in method_definitions:
-        if not isinstance(method_definition, dict):
-            continue
-        method_tool = method_definition.get("mcp_tool")
-        if isinstance(method_tool, str) and method_tool.strip().lower() == lowered_mcp_tool:
-            matches.append(method_definition)
-
+    matches = methods_by_mcp_tool.get(mcp_tool_name.strip().lower())
     if not matches:
         return None
     if len(matches) == 1:
-        return _method_id_from_definition(matches[0])
+        return matches[0][0]
 
     params = parameters if isinstance(parameters, dict) else {}
     has_bank_ids = isinstance(params.get("bank_ids"), list) and len(params["bank_ids"]) > 0
     has_bank_id = isinstance(params.get("bank_id"), str) and bool(params.get("bank_id").strip())
 
     if has_bank_ids:
-        for method_definition in matches:
-            method_id = _method_id_from_definition(method_definition)
+        for method_id, parameter_keys in matches:
             if method_id == "compare_banks":
                 return method_id
-            if "bank_ids" in _parameter_keys_from_method(method_definition):
+            if "bank_ids" in parameter_keys:
                 return method_id
 
     if has_bank_id:
-        for method_definition in matches:
-            method_id = _method_id_from_definition(method_definition)
+        for method_id, parameter_keys in matches:
             if method_id == "by_quarter":
                 return method_id
-            if "bank_id" in _parameter_keys_from_method(method_definition):
+            if "bank_id" in parameter_keys:
                 return method_id
 
     # Ambiguous fallback: prefer by_quarter if present, else first matching method.
-    for method_definition in matches:
-        method_id = _method_id_from_definition(method_definition)
+    for method_id, _ in matches:
         if method_id == "by_quarter":
             return method_id
-    return _method_id_from_definition(matches[0])
+    return matches[0][0]
 
 
 def _normalize_data_input_identifiers(
     input_config: dict[str, Any],
-    registry_by_id: dict[str, dict[str, Any]],
+    method_index_by_source: dict[str, dict[str, dict]],
     source_id_lookup: dict[str, str],
     source_name_lookup: dict[str, str],
 ) -> None:
@@ -433,19 +474,10 @@ def _normalize_data_input_identifiers(
     source_id = input_config.get("source_id")
     if not isinstance(source_id, str):
         return
-    source_definition = registry_by_id.get(source_id)
-    if not isinstance(source_definition, dict):
-        return
-
-    method_definitions = source_definition.get("retrieval_methods")
-    if not isinstance(method_definitions, list):
+    method_index = method_index_by_source.get(source_id)
+    if method_index is None:
         return
-
-    method_lookup: dict[str, str] = {}
-    for method_definition in method_definitions:
-        method_id = _method_id_from_definition(method_definition)
-        if method_id:
-            method_lookup[method_id.lower()] = method_id
+    method_lookup = method_index["method_lookup"]
 
     raw_method_id = input_config.get("method_id")
     if not isinstance(raw_method_id, str) or not raw_method_id.strip():
@@ -477,7 +509,7 @@ def _normalize_data_input_identifiers(
 
     # Handle MCP tool-name aliases like `search_transcripts`.
     mcp_alias_method_id = _choose_method_from_mcp_tool(
-        method_definitions,
+        method_index["by_mcp_tool"],
         raw_method_id,
         parameters,
     )
@@ -485,7 +517,20 @@ def _normalize_data_input_identifiers(
         input_config["method_id"] = mcp_alias_method_id
 
 
-def _normalize_configure_arguments(arguments: dict[str, Any]) -> dict[str, Any]:
+def _copy_input_config(input_config: Any) -> Any:
+    """Copy an input and its parameters so normalization can edit them in place."""
+    if not isinstance(input_config, dict):
+        return input_config
+    copied = dict(input_config)
+    if isinstance(copied.get("parameters"), dict):
+        copied["parameters"] = dict(copied["parameters"])
+    return copied
+
+
+def _normalize_configure_arguments(
+    arguments: dict[str, Any],
+    subsection_cache: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     """
     Normalize configure_subsection arguments to canonical schema.
 
@@ -493,103 +538,106 @@ def _normalize_configure_arguments(arguments: dict[str, Any]) -> dict[str, Any]:
       data_source_config.parameters
     instead of:
       data_source_config.inputs[i].parameters
+
+    Only the containers rewritten below (the config, each input and its
+    parameters) are copied, so the caller's arguments are never mutated.
+
+    Pass subsection_cache to reuse existing-subsection reads across calls
+    that cannot observe writes in between.
     """
-    normalized = deepcopy(arguments)
+    normalized = dict(arguments)
     config = normalized.get("data_source_config")
     if not isinstance(config, dict):
         return normalized
+    config = dict(config)
 
     subsection_id = normalized.get("subsection_id")
     existing_config: dict[str, Any] | None = None
     if isinstance(subsection_id, str) and subsection_id:
-        existing_subsection = get_subsection(subsection_id, include_versions=False)
+        if subsection_cache is not None and subsection_id in subsection_cache:
+            existing_subsection = subsection_cache[subsection_id]
+        else:
+            existing_subsection = get_subsection(subsection_id, include_versions=False)
+            if subsection_cache is not None:
+                subsection_cache[subsection_id] = existing_subsection
         if isinstance(existing_subsection, dict) and "error" not in existing_subsection:
             candidate_config = existing_subsection.get("data_source_config")
             if isinstance(candidate_config, dict):
                 existing_config = candidate_config
 
     shared_parameters = config.get("parameters")
+    if not isinstance(shared_parameters, dict):
+        shared_parameters = None
     inputs = config.get("inputs")
-    if isinstance(shared_parameters, dict) and isinstance(inputs, list):
+    if isinstance(inputs, list):
+        inputs = [_copy_input_config(input_config) for input_config in inputs]
+        config["inputs"] = inputs
+        if shared_parameters is not None:
+            config.pop("parameters", None)
+
+        _, source_id_lookup, source_name_lookup, method_index_by_source = (
+            get_data_source_lookups()
+        )
+
+        # First existing input per (source_id, method_id) that carries parameters.
+        existing_parameters_by_key: dict[tuple[str, str], dict[str, Any]] = {}
+        existing_inputs = existing_config.get("inputs") if existing_config else None
+        if isinstance(existing_inputs, list):
+            for existing_input in existing_inputs:
+                if not isinstance(existing_input, dict):
+                    continue
+                existing_source_id = existing_input.get("source_id")
+                existing_method_id = existing_input.get("method_id")
+                if (
+                    isinstance(existing_source_id, str)
+                    and isinstance(existing_method_id, str)
+                    and isinstance(existing_input.get("parameters"), dict)
+                ):
+                    existing_parameters_by_key.setdefault(
+                        (existing_source_id, existing_method_id),
+                        existing_input["parameters"],
+                    )
+
         for input_config in inputs:
             if not isinstance(input_config, dict):
                 continue
-            existing_parameters = input_config.get("parameters")
-            if not isinstance(existing_parameters, dict):
-                existing_parameters = {}
-            merged_parameters = {**shared_parameters, **existing_parameters}
-            if merged_parameters:
-                input_config["parameters"] = merged_parameters
-        config.pop("parameters", None)
-
-    # Canonicalize source/method aliases from model-generated variants.
-    if isinstance(inputs, list):
-        data_sources = get_data_sources(active_only=True)
-        registry_by_id = {
-            source["id"]: source
-            for source in data_sources
-            if isinstance(source, dict) and isinstance(source.get("id"), str)
-        }
-        source_id_lookup = {source_id.lower(): source_id for source_id in registry_by_id}
-        source_name_lookup = {}
-        for source in data_sources:
-            if not isinstance(source, dict):
-                continue
-            source_name = source.get("name")
-            source_id = source.get("id")
-            if isinstance(source_name, str) and isinstance(source_id, str):
-                source_name_lookup[source_name.strip().lower()] = source_id
 
-        for input_config in inputs:
+            # Fold legacy top-level parameters into each input.
+            if shared_parameters is not None:
+                existing_parameters = input_config.get("parameters")
+                if not isinstance(existing_parameters, dict):
+                    existing_parameters = {}
+                merged_parameters = {**shared_parameters, **existing_parameters}
+                if merged_parameters:
+                    input_config["parameters"] = merged_parameters
+
+            # Canonicalize source/method aliases from model-generated variants.
             _normalize_data_input_identifiers(
                 input_config,
-                registry_by_id,
+                method_index_by_source,
                 source_id_lookup,
                 source_name_lookup,
             )
 
-    # Backfill missing per-input parameters from existing subsection config when available.
-    if isinstance(inputs, list) and isinstance(existing_config, dict):
-        existing_inputs = (
-            existing_config.get("inputs")
-            if isinstance(existing_config, dict)
-            else None
-        )
-        if isinstance(existing_inputs, list):
-            for input_config in inputs:
-                if not isinstance(input_config, dict):
-                    continue
-                input_parameters = input_config.get("parameters")
-                if isinstance(input_parameters, dict) and input_parameters:
-                    continue
-
-                source_id = input_config.get("source_id")
-                method_id = input_config.get("method_id")
-                if not isinstance(source_id, str) or not isinstance(method_id, str):
-                    continue
-
-                matching_existing = next(
-                    (
-                        existing_input
-                        for existing_input in existing_inputs
-                        if (
-                            isinstance(existing_input, dict)
-                            and existing_input.get("source_id") == source_id
-                            and existing_input.get("method_id") == method_id
-                            and isinstance(existing_input.get("parameters"), dict)
-                        )
-                    ),
-                    None,
-                )
-                if matching_existing:
-                    input_config["parameters"] = dict(matching_existing["parameters"])
+            # Backfill missing parameters from the existing subsection config.
+            input_parameters = input_config.get("parameters")
+            if isinstance(input_parameters, dict) and input_parameters:
+                continue
+            source_id = input_config.get("source_id")
+            method_id = input_config.get("method_id")
+            if not isinstance(source_id, str) or not isinstance(method_id, str):
+                continue
+            matching_parameters = existing_parameters_by_key.get((source_id, method_id))
+            if matching_parameters is not None:
+                input_config["parameters"] = dict(matching_parameters)
 
     # Preserve existing visualization settings when a follow-up configure call
     # omits visualization fields for an already-charted subsection.
     if "visualization" not in config and isinstance(existing_config, dict):
         existing_visualization = existing_config.get("visualization")
         if isinstance(existing_visualization, dict):
-            config["visualization"] = deepcopy(existing_visualization)
+            # Downstream validation only reads it and builds its own dict.
+            config["visualization"] = dict(existing_visualization)
 
     normalized["data_source_config"] = config
     return normalized
@@ -624,7 +672,7 @@ def _score_configure_arguments(arguments: dict[str, Any]) -> int:
                 score += 2
             parameters = input_config.get("parameters")
             if isinstance(parameters, dict):
-                score += len([k for k, v in parameters.items() if k and v is not None])
+                score += sum(1 for k, v in parameters.items() if k and v is not None)
 
     dependencies = config.get("dependencies")
     if isinstance(dependencies, dict):
@@ -659,27 +707,43 @@ def _choose_best_configure_calls(
     Returns:
         Map of tool_call index -> subsection_id for calls that should execute.
     """
+    configure_calls = [
+        (index, tool_call)
+        for index, tool_call in enumerate(tool_calls)
+        if tool_call.function.name == "configure_subsection"
+    ]
+    if not configure_calls:
+        return {}
+
     best_by_subsection: dict[str, tuple[int, int]] = {}
+    # Repeated identical payloads are parsed and normalized only once.
+    scored_by_payload: dict[str, tuple[Any, int]] = {}
+    # Nothing is written while choosing, so each subsection is read once.
+    subsection_cache: dict[str, Any] = {}
+
+    for index, tool_call in configure_calls:
+        payload = tool_call.function.arguments
+        scored = scored_by_payload.get(payload) if isinstance(payload, str) else None
+        if scored is None:
+            try:
+                raw_arguments = _loads_tool_arguments(payload)
+            except (json.JSONDecodeError, TypeError):
+                continue
 
-    for index, tool_call in enumerate(tool_calls):
-        if tool_call.function.name != "configure_subsection":
-            continue
-        try:
-            raw_arguments = json.loads(tool_call.function.arguments)
-        except (json.JSONDecodeError, TypeError):
-            continue
+            arguments = _normalize_tool_references(
+                raw_arguments,
+                section_reference_map,
+                subsection_reference_map,
+            )
+            arguments = _normalize_configure_arguments(arguments, subsection_cache)
+            scored = (arguments.get("subsection_id"), _score_configure_arguments(arguments))
+            if isinstance(payload, str):
+                scored_by_payload[payload] = scored
 
-        arguments = _normalize_tool_references(
-            raw_arguments,
-            section_reference_map,
-            subsection_reference_map,
-        )
-        arguments = _normalize_configure_arguments(arguments)
-        subsection_id = arguments.get("subsection_id")
+        subsection_id, score = scored
         if not isinstance(subsection_id, str) or not subsection_id:
             continue
 
-        score = _score_configure_arguments(arguments)
         current = best_by_subsection.get(subsection_id)
         if current is None or score > current[0] or (score == current[0] and index > current[1]):
             best_by_subsection[subsection_id] = (score, index)
@@ -704,13 +768,58 @@ def execute_tool(tool_name: str, arguments: dict) -> Any:
     Raises:
         ValueError: If tool not found in registry
     """
-    if tool_name not in TOOL_REGISTRY:
+    func = TOOL_REGISTRY.get(tool_name)
+    if func is None:
         raise ValueError(f"Unknown tool: {tool_name}")
 
-    func = TOOL_REGISTRY[tool_name]
     return func(**arguments)
 
 
+def _start_parallel_retrievals(
+    tool_calls: list[Any],
+    section_reference_map: dict[str, str],
+    subsection_reference_map: dict[str, str],
+) -> dict[int, tuple[dict[str, Any], Future]]:
+    """
+    Start an assistant message's data retrieval calls concurrently.
+
+    Returns {tool_call index: (normalized arguments, future)}. The chat loop
+    still walks calls in order and only uses a future when its arguments
+    match, so logging and error handling are unchanged.
+    """
+    candidates: dict[int, dict[str, Any]] = {}
+    for index, tool_call in enumerate(tool_calls):
+        if tool_call.function.name not in PARALLEL_RETRIEVAL_TOOLS:
+            continue
+        try:
+            arguments = _loads_tool_arguments(tool_call.function.arguments)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        if not isinstance(arguments, dict):
+            continue
+        candidates[index] = _normalize_tool_references(
+            arguments,
+            section_reference_map,
+            subsection_reference_map,
+        )
+
+    # A single retrieval gains nothing from running ahead
+    if len(candidates) < 2:
+        return {}
+
+    return {
+        index: (
+            arguments,
+            _RETRIEVAL_EXECUTOR.submit(
+                execute_tool,
+                tool_calls[index].function.name,
+                arguments,
+            ),
+        )
+        for index, arguments in candidates.items()
+    }
+
+
 def _build_tool_log_entry(
     tool_name: str,
     arguments: dict[str, Any],
@@ -809,7 +918,13 @@ def _inject_reference_guidance(schema: dict[str, Any]) -> dict[str, Any]:
 
     This nudges the model to emit compact refs (S1/S1A) in tool calls, while
     keeping UUIDs supported as a fallback.
+
+    Schemas that never mention a hinted field are returned as-is.
     """
+    serialized = json.dumps(schema, default=str)
+    if not any(f'"{field}"' in serialized for field in REFERENCE_FIELD_HINTS):
+        return schema
+
     normalized = deepcopy(schema)
 
     def _visit(node: Any) -> None:
@@ -890,10 +1005,15 @@ def convert_mcp_to_openai_tools(mcp_tools: list[dict]) -> list[dict]:
     return openai_tools
 
 
+@lru_cache(maxsize=1)
+def _build_openai_tools() -> tuple[dict, ...]:
+    """Convert the static MCP tool definitions once per process."""
+    return tuple(convert_mcp_to_openai_tools(_get_all_mcp_tools()))
+
+
 def get_openai_tools() -> list[dict]:
     """Get all tools in OpenAI function format."""
-    mcp_tools = _get_all_mcp_tools()
-    return convert_mcp_to_openai_tools(mcp_tools)
+    return list(_build_openai_tools())
 
 
 # ============================================================
@@ -1017,6 +1137,7 @@ def build_system_prompt(
     # Get template info
     section_ref_by_id: dict[str, str] = {}
     subsection_ref_by_id: dict[str, str] = {}
+    detailed_sections = None
 
     template_data = get_template(template_id)
     if "error" in template_data:
@@ -1115,8 +1236,12 @@ def build_system_prompt(
         current_section_ref = section_ref_by_id.get(focus_section_id, focus_section_id)
         focus_context = f"\n## Current Focus\nWorking on Section: {current_section_ref}"
 
-        # Get all subsections in this section for context
-        section_data = get_sections(template_id, include_content=False)
+        # Get all subsections in this section for context, reusing the read above
+        section_data = (
+            detailed_sections
+            if isinstance(detailed_sections, list)
+            else get_sections(template_id, include_content=False)
+        )
         focused_section = next((s for s in section_data if s['id'] == focus_section_id), None)
         if focused_section:
             focus_context += f"\nSection Title: {focused_section.get('title', 'Untitled')}"
@@ -1217,11 +1342,13 @@ async def chat_with_agent(
 
     # Get tools in OpenAI format
     openai_tools = get_openai_tools()
-    section_reference_map, subsection_reference_map = _build_reference_maps(template_id)
-    section_id_to_ref, subsection_id_to_ref = _build_primary_id_to_ref_maps(
+    (
         section_reference_map,
         subsection_reference_map,
-    )
+        id_to_ref,
+    ) = _build_reference_maps(template_id)
+
+    openai_model, openai_max_tokens, _ = get_chat_runtime()
 
     # Tool calling loop
     tool_calls_log = []
@@ -1234,14 +1361,14 @@ async def chat_with_agent(
 
         # Call OpenAI
         request_kwargs = {
-            "model": OPENAI_MODEL,
+            "model": openai_model,
             "messages": messages,
             "tools": openai_tools,
             "tool_choice": "auto",
         }
-        if OPENAI_MAX_TOKENS is not None:
-            request_kwargs["max_tokens"] = OPENAI_MAX_TOKENS
-        response = client.chat.completions.create(**request_kwargs)
+        if openai_max_tokens is not None:
+            request_kwargs["max_tokens"] = openai_max_tokens
+        response = get_shared_openai_client().chat.completions.create(**request_kwargs)
 
         assistant_message = response.choices[0].message
 
@@ -1287,12 +1414,17 @@ async def chat_with_agent(
             subsection_reference_map,
         )
         best_configure_subsection_ids = set(best_configure_call_indexes.values())
+        parallel_retrievals = _start_parallel_retrievals(
+            assistant_message.tool_calls,
+            section_reference_map,
+            subsection_reference_map,
+        )
 
         # Execute each tool call
         for index, tool_call in enumerate(assistant_message.tool_calls):
             tool_name = tool_call.function.name
             try:
-                arguments = json.loads(tool_call.function.arguments)
+                arguments = _loads_tool_arguments(tool_call.function.arguments)
             except json.JSONDecodeError as e:
                 arguments = {}
                 result = {"error": f"Invalid JSON arguments: {e}"}
@@ -1304,10 +1436,11 @@ async def chat_with_agent(
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id,
-                    "content": json.dumps(result),
+                    "content": _dumps_tool_result(result),
                 })
                 continue
-            raw_arguments = deepcopy(arguments)
+            # Normalizers return new dicts, so the parsed arguments stay raw
+            raw_arguments = arguments
 
             arguments = _normalize_tool_references(
                 arguments,
@@ -1336,7 +1469,7 @@ async def chat_with_agent(
                         messages.append({
                             "role": "tool",
                             "tool_call_id": tool_call.id,
-                            "content": json.dumps(result, default=str),
+                            "content": _dumps_tool_result(result),
                         })
                         continue
 
@@ -1361,7 +1494,7 @@ async def chat_with_agent(
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call.id,
-                        "content": json.dumps(result, default=str),
+                        "content": _dumps_tool_result(result),
                     })
                     continue
 
@@ -1384,12 +1517,16 @@ async def chat_with_agent(
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call.id,
-                        "content": json.dumps(result, default=str),
+                        "content": _dumps_tool_result(result),
                     })
                     continue
 
             try:
-                result = execute_tool(tool_name, arguments)
+                parallel_retrieval = parallel_retrievals.get(index)
+                if parallel_retrieval is not None and parallel_retrieval[0] == arguments:
+                    result = parallel_retrieval[1].result()
+                else:
+                    result = execute_tool(tool_name, arguments)
                 tool_calls_log.append(
                     _build_tool_log_entry(
                         tool_name,
@@ -1414,13 +1551,11 @@ async def chat_with_agent(
                     and isinstance(result, dict)
                     and "error" not in result
                 ):
-                    section_reference_map, subsection_reference_map = _build_reference_maps(
-                        template_id
-                    )
-                    section_id_to_ref, subsection_id_to_ref = _build_primary_id_to_ref_maps(
+                    (
                         section_reference_map,
                         subsection_reference_map,
-                    )
+                        id_to_ref,
+                    ) = _build_reference_maps(template_id)
             except Exception as e:
                 result = {"error": str(e)}
                 tool_calls_log.append(
@@ -1433,15 +1568,11 @@ async def chat_with_agent(
                 )
 
             # Add tool result to messages
-            model_result = _sanitize_tool_result_for_model(
-                result,
-                section_id_to_ref,
-                subsection_id_to_ref,
-            )
+            model_result = _sanitize_tool_result_for_model(result, id_to_ref)
             messages.append({
                 "role": "tool",
                 "tool_call_id": tool_call.id,
-                "content": json.dumps(model_result, default=str),
+                "content": _dumps_tool_result(model_result),
             })
 
     # Max iterations reached
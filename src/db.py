@@ -14,12 +14,15 @@ import os
 import re
 import sqlite3
 import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
 try:
     import psycopg2
+    import psycopg2.pool
     from psycopg2.extras import RealDictCursor
 except ImportError:  # pragma: no cover - optional when running sqlite only
     psycopg2 = None
@@ -42,6 +45,15 @@ if os.getenv("DB_USER"):
 if os.getenv("DB_PASSWORD"):
     PG_CONFIG["password"] = os.getenv("DB_PASSWORD")
 
+PG_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+PG_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+
+_PG_POOL = None
+_PG_POOL_LOCK = threading.Lock()
+
+# Connection shared by every get_connection() call inside transaction()
+_ACTIVE_CONNECTION: ContextVar[Any] = ContextVar("active_connection", default=None)
+
 _SQLITE_INIT_DONE = False
 _SQLITE_INIT_LOCK = threading.Lock()
 
@@ -161,6 +173,54 @@ class SQLiteConnectionWrapper:
         self._connection.close()
 
 
+class PooledConnection:
+    """psycopg2 connection proxy that returns itself to the pool on close()."""
+
+    def __init__(self, pool, connection):
+        self._pool = pool
+        self._connection = connection
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        # putconn() rolls back any open transaction before reuse
+        self._pool.putconn(connection, close=bool(connection.closed))
+
+
+class SharedConnection:
+    """Connection handle used inside transaction(); the block owns commit and close."""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def commit(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _get_pg_pool():
+    global _PG_POOL
+
+    if _PG_POOL is None:
+        with _PG_POOL_LOCK:
+            if _PG_POOL is None:
+                _PG_POOL = psycopg2.pool.ThreadedConnectionPool(
+                    PG_POOL_MIN_SIZE,
+                    PG_POOL_MAX_SIZE,
+                    **PG_CONFIG,
+                )
+    return _PG_POOL
+
+
 def _sqlite_connect_raw() -> sqlite3.Connection:
     SQLITE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(
@@ -917,7 +977,20 @@ def ensure_column(cur, table_name: str, column_name: str, column_definition: str
 
 
 def get_connection():
-    """Get a DB connection for the configured backend."""
+    """
+    Get a DB connection for the configured backend.
+
+    Postgres connections come from a process-wide pool; calling close()
+    hands them back instead of tearing down the session. Inside a
+    transaction() block the block's shared connection is returned.
+    """
+    shared = _ACTIVE_CONNECTION.get()
+    if shared is not None:
+        return shared
+    return _open_connection()
+
+
+def _open_connection():
     if _is_sqlite():
         initialize_database()
         return SQLiteConnectionWrapper(_sqlite_connect_raw())
@@ -930,7 +1003,39 @@ def get_connection():
     if psycopg2 is None:
         raise RuntimeError("psycopg2 is required for postgres backend but is not installed")
 
-    return psycopg2.connect(**PG_CONFIG)
+    pool = _get_pg_pool()
+    try:
+        return PooledConnection(pool, pool.getconn())
+    except psycopg2.pool.PoolError:
+        # Pool exhausted: fall back to a dedicated connection rather than fail
+        return psycopg2.connect(**PG_CONFIG)
+
+
+@contextmanager
+def transaction():
+    """
+    Run every get_connection()/query() call in the block on one connection.
+
+    Helpers' own commit()/close() calls become no-ops; the block commits
+    once on success and rolls back on error. Nested blocks join the outer one.
+    """
+    shared = _ACTIVE_CONNECTION.get()
+    if shared is not None:
+        yield shared
+        return
+
+    conn = _open_connection()
+    shared = SharedConnection(conn)
+    token = _ACTIVE_CONNECTION.set(shared)
+    try:
+        yield shared
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        _ACTIVE_CONNECTION.reset(token)
+        conn.close()
 
 
 def query(sql: str, params: tuple | None = None) -> list[dict]:
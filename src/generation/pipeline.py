@@ -44,12 +44,7 @@ from ..retrievers.transcripts import search_transcripts
 from ..retrievers.financials import search_financials
 from ..retrievers.stock_prices import search_stock_prices
 from ..uploads import get_upload_content
-from ..infra.llm import get_openai_client, resolve_chat_runtime
-
-
-# Configuration
-OPENAI_MODEL, OPENAI_MAX_TOKENS, _OPENAI_AUTH_MODE = resolve_chat_runtime()
-client = get_openai_client()
+from ..infra.llm import get_chat_runtime, get_shared_openai_client
 
 
 class GenerationStatus(str, Enum):
@@ -1632,8 +1627,9 @@ Example:
 {data_context}"""
 
     # Call LLM
+    openai_model, openai_max_tokens, _ = get_chat_runtime()
     request_kwargs = {
-        "model": OPENAI_MODEL,
+        "model": openai_model,
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_message},
@@ -1641,9 +1637,9 @@ Example:
         "temperature": 0.7,
         "response_format": {"type": "json_object"},
     }
-    if OPENAI_MAX_TOKENS is not None:
-        request_kwargs["max_tokens"] = OPENAI_MAX_TOKENS
-    response = client.chat.completions.create(**request_kwargs)
+    if openai_max_tokens is not None:
+        request_kwargs["max_tokens"] = openai_max_tokens
+    response = get_shared_openai_client().chat.completions.create(**request_kwargs)
 
     response_text = response.choices[0].message.content or "{}"
 
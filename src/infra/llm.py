@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from openai import OpenAI
@@ -26,6 +27,12 @@ def get_openai_client(settings: Settings | None = None) -> OpenAI:
     return OpenAI(api_key=token, base_url=base_url)
 
 
+@lru_cache(maxsize=1)
+def get_shared_openai_client() -> OpenAI:
+    """Process-wide client, created on first use rather than at import time."""
+    return get_openai_client()
+
+
 def resolve_chat_runtime(settings: Settings | None = None) -> tuple[str, Optional[int], str]:
     """Resolve model + max_tokens from env, with auth-mode-aware model overrides."""
     settings = settings or get_settings()
@@ -48,3 +55,9 @@ def resolve_chat_runtime(settings: Settings | None = None) -> tuple[str, Optiona
         raise ValueError("AGENT_MAX_TOKENS values must be positive integers")
 
     return model, max_tokens, mode
+
+
+@lru_cache(maxsize=1)
+def get_chat_runtime() -> tuple[str, Optional[int], str]:
+    """Process-wide resolve_chat_runtime() result, resolved on first use."""
+    return resolve_chat_runtime()
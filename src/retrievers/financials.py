@@ -5,6 +5,7 @@ Retrieves financial metrics for Canadian Big 6 banks.
 """
 
 from ..db import query
+from .periods import group_rows, period_filter, period_key
 
 
 # Valid values for documentation
@@ -77,6 +78,25 @@ def search_financials(
     if metrics is None:
         metrics = METRIC_IDS
 
+    if not queries:
+        return []
+
+    # Fetch every requested bank/period in one query
+    period_sql, period_params = period_filter(queries)
+    placeholders = ",".join(["%s"] * len(metrics))
+    params = period_params + tuple(metrics)
+
+    sql = f"""
+        SELECT bank_id, fiscal_year, fiscal_quarter,
+               metric_id, metric_name, value, unit, formatted_value
+        FROM financials
+        WHERE {period_sql}
+          AND metric_id IN ({placeholders})
+        ORDER BY metric_id
+    """
+
+    rows_by_period = group_rows(query(sql, params))
+
     results = []
 
     for q in queries:
@@ -84,21 +104,7 @@ def search_financials(
         fiscal_year = q["fiscal_year"]
         fiscal_quarter = q["fiscal_quarter"]
 
-        # Build metric filter
-        placeholders = ",".join(["%s"] * len(metrics))
-        params = (bank_id, fiscal_year, fiscal_quarter) + tuple(metrics)
-
-        sql = f"""
-            SELECT metric_id, metric_name, value, unit, formatted_value
-            FROM financials
-            WHERE bank_id = %s
-              AND fiscal_year = %s
-              AND fiscal_quarter = %s
-              AND metric_id IN ({placeholders})
-            ORDER BY metric_id
-        """
-
-        rows = query(sql, params)
+        rows = rows_by_period.get(period_key(bank_id, fiscal_year, fiscal_quarter), [])
 
         if not rows:
             results.append({
@@ -0,0 +1,44 @@
+"""
+Bank/Period Query Helpers
+
+Shared helpers for retrieving many bank/period combinations in one query.
+"""
+
+
+def period_key(bank_id, fiscal_year, fiscal_quarter) -> tuple:
+    """
+    Normalized key for matching result rows back to requested queries.
+
+    fiscal_year is compared as a string so callers passing "2025" still
+    match the integer column value.
+    """
+    return (bank_id, str(fiscal_year), fiscal_quarter)
+
+
+def period_filter(queries: list[dict]) -> tuple[str, tuple]:
+    """
+    Build a WHERE fragment matching any requested bank/period combination.
+
+    Args:
+        queries: List of {bank_id, fiscal_year, fiscal_quarter} dicts
+
+    Returns:
+        (sql_fragment, params) using %s placeholders; duplicate
+        combinations are only matched once.
+    """
+    combos = list(dict.fromkeys(
+        (q["bank_id"], q["fiscal_year"], q["fiscal_quarter"]) for q in queries
+    ))
+    clause = "(bank_id = %s AND fiscal_year = %s AND fiscal_quarter = %s)"
+    sql = "(" + " OR ".join([clause] * len(combos)) + ")"
+    params = tuple(value for combo in combos for value in combo)
+    return sql, params
+
+
+def group_rows(rows: list[dict]) -> dict[tuple, list[dict]]:
+    """Group result rows by period_key, preserving row order within each group."""
+    grouped: dict[tuple, list[dict]] = {}
+    for row in rows:
+        key = period_key(row["bank_id"], row["fiscal_year"], row["fiscal_quarter"])
+        grouped.setdefault(key, []).append(row)
+    return grouped
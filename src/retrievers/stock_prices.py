@@ -5,6 +5,7 @@ Retrieves stock price data for Canadian Big 6 banks.
 """
 
 from ..db import query
+from .periods import group_rows, period_filter, period_key
 
 
 # Valid values for documentation
@@ -42,6 +43,22 @@ def search_stock_prices(queries: list[dict]) -> list[dict]:
     Returns:
         List of results, one per query combination
     """
+    if not queries:
+        return []
+
+    # Fetch every requested bank/period in one query
+    period_sql, params = period_filter(queries)
+
+    sql = f"""
+        SELECT bank_id, fiscal_year, fiscal_quarter,
+               close_price, qoq_change_pct, yoy_change_pct,
+               period_end_date
+        FROM stock_prices
+        WHERE {period_sql}
+    """
+
+    rows_by_period = group_rows(query(sql, params))
+
     results = []
 
     for q in queries:
@@ -49,17 +66,7 @@ def search_stock_prices(queries: list[dict]) -> list[dict]:
         fiscal_year = q["fiscal_year"]
         fiscal_quarter = q["fiscal_quarter"]
 
-        sql = """
-            SELECT bank_id, fiscal_year, fiscal_quarter,
-                   close_price, qoq_change_pct, yoy_change_pct,
-                   period_end_date
-            FROM stock_prices
-            WHERE bank_id = %s
-              AND fiscal_year = %s
-              AND fiscal_quarter = %s
-        """
-
-        rows = query(sql, (bank_id, fiscal_year, fiscal_quarter))
+        rows = rows_by_period.get(period_key(bank_id, fiscal_year, fiscal_quarter), [])
 
         if not rows:
             results.append({
@@ -6,6 +6,7 @@ Retrieves earnings call transcript sections for Canadian Big 6 banks.
 
 from typing import Literal
 from ..db import query
+from .periods import group_rows, period_filter, period_key
 
 
 # Valid values for documentation
@@ -41,6 +42,28 @@ def search_transcripts(
     Returns:
         List of results, one per query combination
     """
+    if not queries:
+        return []
+
+    # Fetch every requested bank/period in one query
+    period_sql, params = period_filter(queries)
+    if section == "both":
+        section_filter = "1=1"  # No filter
+    else:
+        section_filter = "section = %s"
+        params += (section,)
+
+    sql = f"""
+        SELECT bank_id, fiscal_year, fiscal_quarter, section,
+               content_text, call_date
+        FROM transcripts
+        WHERE {period_sql}
+          AND {section_filter}
+        ORDER BY section
+    """
+
+    rows_by_period = group_rows(query(sql, params))
+
     results = []
 
     for q in queries:
@@ -48,26 +71,7 @@ def search_transcripts(
         fiscal_year = q["fiscal_year"]
         fiscal_quarter = q["fiscal_quarter"]
 
-        # Build section filter
-        if section == "both":
-            section_filter = "1=1"  # No filter
-            params = (bank_id, fiscal_year, fiscal_quarter)
-        else:
-            section_filter = "section = %s"
-            params = (bank_id, fiscal_year, fiscal_quarter, section)
-
-        sql = f"""
-            SELECT bank_id, fiscal_year, fiscal_quarter, section,
-                   content_text, call_date
-            FROM transcripts
-            WHERE bank_id = %s
-              AND fiscal_year = %s
-              AND fiscal_quarter = %s
-              AND {section_filter}
-            ORDER BY section
-        """
-
-        rows = query(sql, params)
+        rows = rows_by_period.get(period_key(bank_id, fiscal_year, fiscal_quarter), [])
 
         if not rows:
             results.append({
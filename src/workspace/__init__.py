@@ -5,6 +5,7 @@ Provides MCP tools for managing templates, sections, subsections,
 conversations, and data sources.
 """
 
+from ..db import transaction as workspace_transaction
 from .templates import (
     get_template,
     create_template,
@@ -35,6 +36,7 @@ from .subsections import (
 )
 from .data_sources import (
     get_data_sources,
+    get_data_source_lookups,
     TOOL_DEFINITION as DATA_SOURCES_TOOL,
 )
 from .conversations import (
@@ -58,6 +60,8 @@ from .generation_presets import (
 )
 
 __all__ = [
+    # Transactions
+    "workspace_transaction",
     # Templates
     "get_template",
     "create_template",
@@ -85,6 +89,7 @@ __all__ = [
     "SUBSECTION_TOOLS",
     # Data sources
     "get_data_sources",
+    "get_data_source_lookups",
     "DATA_SOURCES_TOOL",
     # Conversations
     "get_or_create_conversation",
@@ -5,6 +5,8 @@ Provides access to the registry of available data sources
 that can be used to populate report subsections.
 """
 
+import os
+import time
 from copy import deepcopy
 from typing import Any
 
@@ -85,20 +87,41 @@ def get_section_period_anchor_quarter_key(section_id: str) -> str:
     return f"section_{section_id}_{PERIOD_ANCHOR_QUARTER_KEY}"
 
 
-def get_data_sources(
-    category: str = None,
-    active_only: bool = True,
-) -> list[dict]:
-    """
-    Get available data sources from the registry.
+# Registry edits made by other processes (seeding, is_active toggles) become
+# visible once a cached read is this many seconds old.
+DATA_SOURCE_CACHE_TTL_SECONDS = float(os.getenv("DATA_SOURCE_CACHE_TTL_SECONDS", "30"))
 
-    Args:
-        category: Filter by category (optional)
-        active_only: Only return active sources (default True)
+# (category, active_only) -> (expires_at, rows); see _load_registry_sources
+_REGISTRY_CACHE: dict[tuple[str | None, bool], tuple[float, tuple[dict, ...]]] = {}
+# (expires_at, lookups); see get_data_source_lookups
+_DATA_SOURCE_LOOKUPS: tuple[float, tuple] | None = None
 
-    Returns:
-        List of data sources with retrieval methods
+
+def _load_registry_sources(category: str | None, active_only: bool) -> tuple[dict, ...]:
     """
+    Read registry rows per (category, active_only), cached for a short TTL.
+
+    Reads within DATA_SOURCE_CACHE_TTL_SECONDS reuse the cached rows, so a
+    registry change made by another process (a reseed, an is_active toggle)
+    is seen by this process within that window. clear_data_source_cache()
+    drops the cache immediately. Empty results are not cached: an unseeded
+    registry must not hide rows that are seeded later.
+    """
+    cache_key = (category, active_only)
+    cached = _REGISTRY_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+
+    sources = _query_registry_sources(category, active_only)
+    if sources:
+        _REGISTRY_CACHE[cache_key] = (time.monotonic() + DATA_SOURCE_CACHE_TTL_SECONDS, sources)
+    else:
+        _REGISTRY_CACHE.pop(cache_key, None)
+    return sources
+
+
+def _query_registry_sources(category: str | None, active_only: bool) -> tuple[dict, ...]:
+    """Read registry rows matching the filters."""
     conditions = []
     params = []
 
@@ -110,7 +133,6 @@ def get_data_sources(
 
     where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-    sources: list[dict] = []
     conn = get_connection()
     try:
         with conn.cursor() as cur:
@@ -122,7 +144,7 @@ def get_data_sources(
                 ORDER BY category, name
             """, tuple(params) if params else None)
 
-            sources = [
+            return tuple(
                 {
                     "id": row[0],
                     "name": row[1],
@@ -134,10 +156,34 @@ def get_data_sources(
                     "created_at": str(row[7]) if row[7] else None,
                 }
                 for row in cur.fetchall()
-            ]
+            )
     finally:
         conn.close()
 
+
+def clear_data_source_cache() -> None:
+    """Drop cached registry rows so the next lookup re-reads the table."""
+    global _DATA_SOURCE_LOOKUPS
+    _REGISTRY_CACHE.clear()
+    _DATA_SOURCE_LOOKUPS = None
+
+
+def get_data_sources(
+    category: str = None,
+    active_only: bool = True,
+) -> list[dict]:
+    """
+    Get available data sources from the registry.
+
+    Args:
+        category: Filter by category (optional)
+        active_only: Only return active sources (default True)
+
+    Returns:
+        List of data sources with retrieval methods
+    """
+    sources = deepcopy(list(_load_registry_sources(category or None, active_only)))
+
     if _include_uploaded_documents_source(category, active_only):
         sources.append(deepcopy(UPLOADED_DOCUMENTS_SOURCE))
 
@@ -164,6 +210,85 @@ def _get_param_key(param_def: dict) -> Any:
     return param_def.get("key") or param_def.get("name")
 
 
+def _build_method_index(method_definitions: list) -> dict[str, dict]:
+    """
+    Index one source's retrieval methods for alias resolution.
+
+    Returns:
+        {"method_lookup": {lowered method_id: method_id},
+         "by_mcp_tool": {lowered mcp_tool: [(method_id, parameter keys), ...]}}
+        with by_mcp_tool entries in registry order.
+    """
+    method_lookup: dict[str, str] = {}
+    by_mcp_tool: dict[str, list[tuple[str | None, frozenset[str]]]] = {}
+    for method in method_definitions:
+        if not isinstance(method, dict):
+            continue
+        method_id = _get_method_id(method)
+        if not isinstance(method_id, str) or not method_id:
+            method_id = None
+        if method_id:
+            method_lookup[method_id.lower()] = method_id
+
+        mcp_tool = method.get("mcp_tool")
+        if not isinstance(mcp_tool, str):
+            continue
+        parameters = method.get("parameters")
+        parameter_keys = frozenset(
+            key
+            for key in (
+                _get_param_key(param_def)
+                for param_def in (parameters if isinstance(parameters, list) else ())
+            )
+            if isinstance(key, str) and key
+        )
+        by_mcp_tool.setdefault(mcp_tool.strip().lower(), []).append((method_id, parameter_keys))
+    return {"method_lookup": method_lookup, "by_mcp_tool": by_mcp_tool}
+
+
+def get_data_source_lookups() -> tuple[
+    dict[str, dict], dict[str, str], dict[str, str], dict[str, dict[str, dict]]
+]:
+    """
+    Index active data sources for resolving model-supplied identifiers.
+
+    Returns:
+        (sources_by_id, source_id_by_lower_id, source_id_by_lower_name,
+        method_index_by_source_id). See _build_method_index for the last one.
+        The maps are shared across callers and must be treated as read-only.
+        They are cached only while the active registry rows they were built
+        from are cached, and expire with them.
+    """
+    global _DATA_SOURCE_LOOKUPS
+    if _DATA_SOURCE_LOOKUPS is not None and time.monotonic() < _DATA_SOURCE_LOOKUPS[0]:
+        return _DATA_SOURCE_LOOKUPS[1]
+
+    data_sources = get_data_sources(active_only=True)
+    sources_by_id = {
+        source["id"]: source
+        for source in data_sources
+        if isinstance(source, dict) and isinstance(source.get("id"), str)
+    }
+    source_id_lookup = {source_id.lower(): source_id for source_id in sources_by_id}
+    source_name_lookup = {}
+    for source in data_sources:
+        if not isinstance(source, dict):
+            continue
+        source_name = source.get("name")
+        source_id = source.get("id")
+        if isinstance(source_name, str) and isinstance(source_id, str):
+            source_name_lookup[source_name.strip().lower()] = source_id
+    method_index_by_source = {
+        source_id: _build_method_index(source["retrieval_methods"])
+        for source_id, source in sources_by_id.items()
+        if isinstance(source.get("retrieval_methods"), list)
+    }
+    lookups = (sources_by_id, source_id_lookup, source_name_lookup, method_index_by_source)
+    cached_rows = _REGISTRY_CACHE.get((None, True))
+    _DATA_SOURCE_LOOKUPS = (cached_rows[0], lookups) if cached_rows is not None else None
+    return lookups
+
+
 def is_variable_binding(value: Any) -> bool:
     """Return True if value is a variable binding object like {'$var': 'fiscal_year'}."""
     return (
@@ -951,31 +1076,13 @@ def get_data_source(source_id: str) -> dict:
     if source_id == UPLOADED_DOCUMENTS_SOURCE_ID:
         return deepcopy(UPLOADED_DOCUMENTS_SOURCE)
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT id, name, description, category, retrieval_methods,
-                       suggested_widgets, is_active
-                FROM data_source_registry
-                WHERE id = %s
-            """, (source_id,))
-
-            row = cur.fetchone()
-            if not row:
-                return {"error": f"Data source not found: {source_id}"}
-
-            return {
-                "id": row[0],
-                "name": row[1],
-                "description": row[2],
-                "category": row[3],
-                "retrieval_methods": row[4],
-                "suggested_widgets": row[5],
-                "is_active": row[6],
-            }
-    finally:
-        conn.close()
+    for source in _load_registry_sources(None, False):
+        if source["id"] == source_id:
+            return deepcopy({
+                key: value for key, value in source.items() if key != "created_at"
+            })
+
+    return {"error": f"Data source not found: {source_id}"}
 
 
 # Tool definition for MCP server
@@ -10,6 +10,12 @@ import uuid
 from ..db import get_connection
 
 
+def _count_sections(cur, template_id: str) -> int:
+    """Count a template's sections on an open cursor (after a mutation)."""
+    cur.execute("SELECT COUNT(*) FROM sections WHERE template_id = %s", (template_id,))
+    return cur.fetchone()[0]
+
+
 def get_sections(template_id: str, include_content: bool = False) -> list[dict]:
     """
     Get all sections for a template with their subsections.
@@ -32,49 +38,50 @@ def get_sections(template_id: str, include_content: bool = False) -> list[dict]:
                 ORDER BY position
             """, (template_id,))
 
-            sections = []
-            for row in cur.fetchall():
-                section_id = str(row[0])
+            section_rows = cur.fetchall()
+
+            # Get subsections for every section in one query
+            content_field = ", sub.content" if include_content else ""
+            cur.execute(f"""
+                SELECT sub.section_id, sub.id, sub.title, sub.position, sub.widget_type,
+                       sub.data_source_config, sub.notes, sub.instructions,
+                       sub.content_type, sub.version_number{content_field}
+                FROM subsections sub
+                JOIN sections s ON s.id = sub.section_id
+                WHERE s.template_id = %s
+                ORDER BY sub.section_id, sub.position
+            """, (template_id,))
+
+            subsections_by_section: dict[str, list[dict]] = {}
+            for sub_row in cur.fetchall():
+                subsection = {
+                    "id": str(sub_row[1]),
+                    "title": sub_row[2],
+                    "position": sub_row[3],
+                    "widget_type": sub_row[4],
+                    "data_source_config": sub_row[5],
+                    "has_notes": bool(sub_row[6]),
+                    "has_instructions": bool(sub_row[7]),
+                    "content_type": sub_row[8],
+                    "version_number": sub_row[9],
+                }
+                if include_content:
+                    subsection["content"] = sub_row[10]
+                    subsection["notes"] = sub_row[6]
+                    subsection["instructions"] = sub_row[7]
+                subsections_by_section.setdefault(str(sub_row[0]), []).append(subsection)
 
-                # Get subsections for this section
-                content_field = ", content" if include_content else ""
-                cur.execute(f"""
-                    SELECT id, title, position, widget_type, data_source_config,
-                           notes, instructions, content_type, version_number{content_field}
-                    FROM subsections
-                    WHERE section_id = %s
-                    ORDER BY position
-                """, (section_id,))
-
-                subsections = []
-                for sub_row in cur.fetchall():
-                    subsection = {
-                        "id": str(sub_row[0]),
-                        "title": sub_row[1],
-                        "position": sub_row[2],
-                        "widget_type": sub_row[3],
-                        "data_source_config": sub_row[4],
-                        "has_notes": bool(sub_row[5]),
-                        "has_instructions": bool(sub_row[6]),
-                        "content_type": sub_row[7],
-                        "version_number": sub_row[8],
-                    }
-                    if include_content:
-                        subsection["content"] = sub_row[9]
-                        subsection["notes"] = sub_row[5]
-                        subsection["instructions"] = sub_row[6]
-                    subsections.append(subsection)
-
-                sections.append({
-                    "id": section_id,
+            return [
+                {
+                    "id": str(row[0]),
                     "position": row[1],
                     "title": row[2],
                     "created_at": str(row[3]) if row[3] else None,
                     "updated_at": str(row[4]) if row[4] else None,
-                    "subsections": subsections,
-                })
-
-            return sections
+                    "subsections": subsections_by_section.get(str(row[0]), []),
+                }
+                for row in section_rows
+            ]
     finally:
         conn.close()
 
@@ -93,7 +100,8 @@ def create_section(
         position: Position in document (1-indexed). None to append at end.
 
     Returns:
-        Created section with one default subsection
+        Created section with one default subsection, plus the template's
+        new section_count
     """
     section_id = str(uuid.uuid4())
 
@@ -140,6 +148,8 @@ def create_section(
                 "widget_type": sub_row[3],
             }]
 
+            section_count = _count_sections(cur, template_id)
+
             conn.commit()
 
             return {
@@ -148,6 +158,7 @@ def create_section(
                 "title": section_row[2],
                 "created_at": str(section_row[3]) if section_row[3] else None,
                 "subsections": subsections,
+                "section_count": section_count,
             }
     finally:
         conn.close()
@@ -279,7 +290,7 @@ def delete_section(section_id: str) -> dict:
         section_id: UUID of the section
 
     Returns:
-        Confirmation of deletion
+        Confirmation of deletion with the remaining section_count
     """
     conn = get_connection()
     try:
@@ -305,11 +316,14 @@ def delete_section(section_id: str) -> dict:
                 WHERE template_id = %s AND position > %s
             """, (template_id, position))
 
+            section_count = _count_sections(cur, template_id)
+
             conn.commit()
 
             return {
                 "deleted": True,
                 "section_id": section_id,
+                "section_count": section_count,
             }
     finally:
         conn.close()
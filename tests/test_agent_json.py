@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+import math
+import unittest
+from datetime import datetime
+
+from src.api.agent import _dumps_tool_result, _loads_tool_arguments
+
+
+class AgentJsonTests(unittest.TestCase):
+    def test_loads_keeps_integers_beyond_64_bits_exact(self):
+        raw = '{"a": 123456789012345678901234567890, "b": [18446744073709551615, 1.5]}'
+        parsed = _loads_tool_arguments(raw)
+        self.assertEqual(parsed, json.loads(raw))
+        self.assertIsInstance(parsed["a"], int)
+
+    def test_dumps_matches_stdlib_for_big_ints_and_datetimes(self):
+        result = {
+            "value": 2**70,
+            "updated_at": datetime(2025, 1, 1, 3, 4, 5),
+            "rows": [{"id": 1}],
+        }
+        encoded = _dumps_tool_result(result)
+        self.assertEqual(json.loads(encoded), json.loads(json.dumps(result, default=str)))
+        self.assertIn("2025-01-01 03:04:05", encoded)
+
+    def test_loads_accepts_nan_and_infinity_like_stdlib(self):
+        parsed = _loads_tool_arguments('{"a": NaN, "b": [Infinity, -Infinity], "c": 1}')
+        self.assertTrue(math.isnan(parsed["a"]))
+        self.assertEqual(parsed["b"], [math.inf, -math.inf])
+        self.assertEqual(parsed["c"], 1)
+
+    def test_dumps_keeps_non_finite_floats_like_stdlib(self):
+        result = {"metrics": [{"value": float("nan")}, {"value": math.inf}], "note": None}
+        encoded = _dumps_tool_result(result)
+        self.assertEqual(encoded, json.dumps(result, default=str))
+        self.assertIn("NaN", encoded)
+        self.assertIn("Infinity", encoded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import src.db as db
+import src.workspace.data_sources as data_sources
+from src.workspace.data_sources import (
+    clear_data_source_cache,
+    get_data_source,
+    get_data_source_lookups,
+)
+
+SEED_REGISTRY_PATH = Path(__file__).resolve().parents[1] / "scripts" / "database" / "seed_registry.py"
+
+
+def _load_seed_registry_module():
+    spec = importlib.util.spec_from_file_location("seed_registry_under_test", SEED_REGISTRY_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class DataSourceCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._original_backend = db.DB_BACKEND
+        self._original_sqlite_path = db.SQLITE_DB_PATH
+        self._original_init_done = db._SQLITE_INIT_DONE
+
+        db.DB_BACKEND = "sqlite"
+        db.SQLITE_DB_PATH = Path(self._tmpdir.name) / "report_designer.db"
+        db._SQLITE_INIT_DONE = False
+        db.initialize_database(force=True)
+        clear_data_source_cache()
+
+        self._seed_registry = _load_seed_registry_module()
+
+    def tearDown(self) -> None:
+        clear_data_source_cache()
+        db.DB_BACKEND = self._original_backend
+        db.SQLITE_DB_PATH = self._original_sqlite_path
+        db._SQLITE_INIT_DONE = self._original_init_done
+        self._tmpdir.cleanup()
+
+    def _seed(self) -> None:
+        conn = db.get_connection()
+        try:
+            self._seed_registry.seed_registry(conn)
+        finally:
+            conn.close()
+
+    def test_read_before_seeding_does_not_hide_seeded_rows(self):
+        conn = db.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM data_source_registry")
+            conn.commit()
+        finally:
+            conn.close()
+
+        self.assertIn("error", get_data_source("transcripts"))
+        self.assertNotIn("transcripts", get_data_source_lookups()[0])
+
+        self._seed()
+
+        self.assertEqual(get_data_source("transcripts")["id"], "transcripts")
+        self.assertIn("transcripts", get_data_source_lookups()[0])
+
+    def test_reseeding_replaces_cached_rows(self):
+        self.assertEqual(get_data_source("transcripts")["name"], "Earnings Call Transcripts")
+        self.assertIn("earnings call transcripts", get_data_source_lookups()[2])
+
+        self._seed_registry.DATA_SOURCES[0]["name"] = "Call Transcripts"
+        self._seed()
+
+        self.assertEqual(get_data_source("transcripts")["name"], "Call Transcripts")
+        self.assertIn("call transcripts", get_data_source_lookups()[2])
+
+    def test_edits_from_another_process_show_up_after_ttl(self):
+        clock = [1000.0]
+        with mock.patch.object(data_sources.time, "monotonic", side_effect=lambda: clock[0]):
+            self.assertEqual(get_data_source("transcripts")["name"], "Earnings Call Transcripts")
+            self.assertIn("transcripts", get_data_source_lookups()[0])
+
+            # Simulate another process editing the registry directly
+            conn = db.get_connection()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "UPDATE data_source_registry SET name = %s, is_active = FALSE WHERE id = %s",
+                        ("Retired Transcripts", "transcripts"),
+                    )
+                conn.commit()
+            finally:
+                conn.close()
+
+            # Within the TTL the cached rows are served
+            self.assertEqual(get_data_source("transcripts")["name"], "Earnings Call Transcripts")
+            self.assertIn("transcripts", get_data_source_lookups()[0])
+
+            clock[0] += data_sources.DATA_SOURCE_CACHE_TTL_SECONDS + 1
+
+            self.assertEqual(get_data_source("transcripts")["name"], "Retired Transcripts")
+            self.assertNotIn("transcripts", get_data_source_lookups()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import src.db as db
+from src.workspace import workspace_transaction
+from src.workspace.sections import create_section, get_sections
+from src.workspace.templates import create_template, get_template
+
+
+class WorkspaceTransactionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._original_backend = db.DB_BACKEND
+        self._original_sqlite_path = db.SQLITE_DB_PATH
+        self._original_init_done = db._SQLITE_INIT_DONE
+
+        db.DB_BACKEND = "sqlite"
+        db.SQLITE_DB_PATH = Path(self._tmpdir.name) / "report_designer.db"
+        db._SQLITE_INIT_DONE = False
+        db.initialize_database(force=True)
+
+    def tearDown(self) -> None:
+        db.DB_BACKEND = self._original_backend
+        db.SQLITE_DB_PATH = self._original_sqlite_path
+        db._SQLITE_INIT_DONE = self._original_init_done
+        self._tmpdir.cleanup()
+
+    def test_calls_share_one_connection_and_commit_on_exit(self):
+        with workspace_transaction() as conn:
+            self.assertIs(db.get_connection(), conn)
+            template = create_template(name="Txn Template", created_by="txn_test")
+            create_section(template_id=template["id"], title="Overview")
+            with workspace_transaction() as inner:
+                self.assertIs(inner, conn)
+
+        self.assertIsNone(db._ACTIVE_CONNECTION.get())
+        self.assertEqual(len(get_sections(template["id"])), 1)
+
+    def test_error_rolls_back_every_call_in_block(self):
+        with self.assertRaises(RuntimeError):
+            with workspace_transaction():
+                template = create_template(name="Txn Rollback", created_by="txn_test")
+                raise RuntimeError("boom")
+
+        self.assertIsNone(db._ACTIVE_CONNECTION.get())
+        self.assertIn("error", get_template(template["id"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
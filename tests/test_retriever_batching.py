@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import src.db as db
+from src.retrievers.financials import search_financials
+from src.retrievers.stock_prices import search_stock_prices
+from src.retrievers.transcripts import search_transcripts
+
+
+class RetrieverBatchingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._original_backend = db.DB_BACKEND
+        self._original_sqlite_path = db.SQLITE_DB_PATH
+        self._original_init_done = db._SQLITE_INIT_DONE
+
+        db.DB_BACKEND = "sqlite"
+        db.SQLITE_DB_PATH = Path(self._tmpdir.name) / "report_designer.db"
+        db._SQLITE_INIT_DONE = False
+        db.initialize_database(force=True)
+
+        self._queries = [
+            {"bank_id": "TD", "fiscal_year": 2025, "fiscal_quarter": "Q2"},
+            {"bank_id": "XX", "fiscal_year": 2025, "fiscal_quarter": "Q1"},
+            {"bank_id": "RY", "fiscal_year": "2024", "fiscal_quarter": "Q4"},
+        ]
+
+    def tearDown(self) -> None:
+        db.DB_BACKEND = self._original_backend
+        db.SQLITE_DB_PATH = self._original_sqlite_path
+        db._SQLITE_INIT_DONE = self._original_init_done
+        self._tmpdir.cleanup()
+
+    def _assert_matches_single_queries(self, search, *args):
+        batched = search(self._queries, *args)
+        single = [search([q], *args)[0] for q in self._queries]
+        self.assertEqual(batched, single)
+        self.assertEqual([r["bank_id"] for r in batched], ["TD", "XX", "RY"])
+        self.assertIn("error", batched[1])
+        self.assertNotIn("error", batched[2])
+
+    def test_batched_results_match_single_queries(self):
+        self._assert_matches_single_queries(search_transcripts)
+        self._assert_matches_single_queries(search_transcripts, "qa")
+        self._assert_matches_single_queries(search_financials, ["cet1_ratio", "net_income"])
+        self._assert_matches_single_queries(search_stock_prices)
+
+    def test_issues_one_query_per_call(self):
+        with mock.patch("src.retrievers.financials.query", wraps=db.query) as spy:
+            search_financials(self._queries)
+        self.assertEqual(spy.call_count, 1)
+
+    def test_empty_queries_skip_database(self):
+        with mock.patch("src.retrievers.stock_prices.query") as spy:
+            self.assertEqual(search_stock_prices([]), [])
+        spy.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()